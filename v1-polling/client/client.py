@@ -1,8 +1,13 @@
+import anyio
 import asyncio
+import itertools
+import random
 import aiohttp
+import orjson
 from uuid import uuid4
 from typing import Dict, Any, Optional
 import logging
+from common.logging import get_logger
 
 """
     An asynchronous client library for managing translation jobs.
@@ -26,17 +31,18 @@ import logging
 """
 
 # Set up logging
-client_logger = logging.getLogger(__name__)
-client_logger.setLevel(logging.INFO)
-handler = logging.StreamHandler()
-formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-handler.setFormatter(formatter)
-client_logger.addHandler(handler)
+client_logger = get_logger(__name__)
 
 
 class TranslationConfig:
     def __init__(
-        self, base_timeout=30, min_delay=0.5, max_delay=3.0, progressive_delay=True
+        self,
+        base_timeout=30,
+        min_delay=0.5,
+        max_delay=3.0,
+        progressive_delay=True,
+        long_poll=True,
+        max_retries=5,
     ):
         """
         Configuration class for managing translation job timeouts and polling behavior.
@@ -61,11 +67,29 @@ class TranslationConfig:
                                 reduce unnecessary API calls for longer-running jobs.
                                 If False, uses constant min_delay between checks.
                                 Defaults to True.
+
+        :param long_poll: If True, each status request asks the server to hold it
+                         open (up to max_delay seconds) until the job finishes,
+                         so no client-side delay is needed between requests.
+                         Set to False for servers without the ``wait`` parameter.
+                         Defaults to True.
+
+        :param max_retries: Number of attempts for a status check that fails
+                           with a transient error (connection failure, timeout
+                           or 5xx response) before giving up. Retries back off
+                           exponentially from min_delay, capped at max_delay,
+                           with random jitter. Must be at least 1. Defaults to 5.
+
+        :raises ValueError: If max_retries is less than 1
         """
+        if max_retries < 1:
+            raise ValueError(f"max_retries must be at least 1, got {max_retries}")
         self.base_timeout = base_timeout
         self.min_delay = min_delay
         self.max_delay = max_delay
         self.progressive_delay = progressive_delay
+        self.long_poll = long_poll
+        self.max_retries = max_retries
 
 
 class TranslationError(Exception):
@@ -96,15 +120,35 @@ class VideoTranslationClient:
         self.base_url = base_url.rstrip("/")
         self.config = config or TranslationConfig()
         self.session = None
+        # ETag and body of the last status seen for each job still processing
+        self._last_status = {}
+        # Request paths, relative to the session's base_url, built once
+        self._translate_path = "translate"
+        self._job_path = "job/{}".format
+        self._cancel_path = "job/{}/cancel".format
+        # Job IDs are "<client id>-<n>": one random draw per client, not per job
+        self._session_id = uuid4().hex[:12]
+        self._counter = itertools.count()
 
     async def __aenter__(self):
         """
         Set up the HTTP session when entering the async context.
 
+        The session keeps connections alive between requests, so repeated
+        status checks reuse one TCP connection instead of reconnecting.
+
         Returns:
             self: The client instance for use in the async with block.
         """
-        self.session = aiohttp.ClientSession()
+        self.session = aiohttp.ClientSession(
+            # Trailing slash makes request paths relative to any base path
+            base_url=f"{self.base_url}/",
+            connector=aiohttp.TCPConnector(
+                limit=100, keepalive_timeout=75, enable_cleanup_closed=True
+            ),
+            timeout=aiohttp.ClientTimeout(total=None, connect=5, sock_read=10),
+            json_serialize=lambda obj: orjson.dumps(obj).decode(),
+        )
         return self
 
     async def __aexit__(self, *err):
@@ -112,51 +156,147 @@ class VideoTranslationClient:
         Clean up the HTTP session when exiting the async context.
 
         Ensures proper cleanup of network resources even if an error occurred.
+        Closing the session also closes its connector.
         """
         if self.session:
             await self.session.close()
 
     async def start_translation(
-        self, source_lang: str, target_lang: str
+        self, source_lang: str, target_lang: str, wait: float = 0
     ) -> Dict[str, Any]:
         """
         Start a new translation job.
 
         Initiates a new translation job for the specified language pair.
-        Automatically generates a unique job ID for tracking.
+        Automatically generates a job ID for tracking, unique to this client
+        instance and prefixed with a random client identifier.
 
         :param source_lang: Source language code (e.g., 'en')
         :param target_lang: Target language code (e.g., 'es')
+        :param wait: Seconds the server may hold the request open waiting for
+                     the job to finish; the response is then the job status
         :returns: API response containing job details including job_id
         :raises: aiohttp.ClientError: On API communication failures
         """
         # Send an asynchronous HTTP POST request to the translation endpoint
         async with self.session.post(
-            f"{self.base_url}/translate",
+            self._translate_path,
+            params={"wait": wait} if wait > 0 else None,
             json={
-                "job_id": str(uuid4()),
+                "job_id": f"{self._session_id}-{next(self._counter)}",
                 "source_language": source_lang,
                 "target_language": target_lang,
             },
-            timeout=10,
+            timeout=10 + wait,
         ) as response:
             response.raise_for_status()
-            return await response.json()
+            return orjson.loads(await response.read())
 
-    async def get_status(self, job_id: str) -> Dict[str, Any]:
+    async def translate_and_wait(
+        self, source_lang: str, target_lang: str, wait: float = 30
+    ) -> Dict[str, Any]:
+        """
+        Start a translation job and wait for it to complete.
+
+        The submit request itself waits server-side for up to ``wait``
+        seconds, so jobs finishing within that time take a single request.
+        Slower jobs fall back to wait_for_completion.
+
+        :param source_lang: Source language code (e.g., 'en')
+        :param target_lang: Target language code (e.g., 'es')
+        :param wait: Seconds to wait on the submit request (at most 30)
+        :returns: Final job status and results when complete
+        :raises:
+            TimeoutError: If job doesn't complete within base_timeout
+            TranslationError: If job fails or API communication fails
+        """
+        try:
+            job = await self.start_translation(
+                source_lang, target_lang, wait=min(wait, 30)
+            )
+        except aiohttp.ClientError as e:
+            raise TranslationError(f"Error communicating with server: {e}") from e
+
+        if job.get("status") == "completed":
+            client_logger.info(f"Job {job['job_id']} completed successfully.")
+            return job
+        if job.get("status") == "error":
+            error_message = job.get("error_message", "Unknown error")
+            client_logger.error(f"Translation failed: {error_message}")
+            raise TranslationError(f"Translation failed: {error_message}")
+        return await self.wait_for_completion(job["job_id"])
+
+    async def get_status(self, job_id: str, wait: float = 0) -> Dict[str, Any]:
         """
         Check the current status of a translation job.
 
+        While a job is processing, the request sends the ETag of the last
+        status seen. When the server answers 304 Not Modified, the cached
+        status is returned without a body to download or parse.
+
         :param job_id: The ID of the job to check
+        :param wait: Seconds the server may hold the request open waiting for
+                     the job to finish (long-poll); 0 returns immediately
         :returns: API response containing current job status and details
         :raises: aiohttp.ClientError: On API communication failures
         """
+        cached = self._last_status.get(job_id)
         # Send an asynchronous HTTP GET request to retrieve the job status
         async with self.session.get(
-            f"{self.base_url}/job/{job_id}", timeout=5
+            self._job_path(job_id),
+            params={"wait": wait} if wait > 0 else None,
+            headers={"If-None-Match": cached[0]} if cached else None,
+            timeout=5 + wait,
         ) as response:
             response.raise_for_status()
-            return await response.json()
+            if response.status == 304 and cached:
+                return cached[1]
+            status = orjson.loads(await response.read())
+
+        etag = response.headers.get("ETag")
+        if etag and status["status"] == "processing":
+            self._last_status[job_id] = (etag, status)
+        else:
+            self._last_status.pop(job_id, None)
+        return status
+
+    async def _get_status_retry(self, job_id: str, wait: float = 0) -> Dict[str, Any]:
+        """
+        Check job status, retrying transient failures with jittered backoff.
+
+        Connection errors, timeouts and 5xx responses are retried up to
+        max_retries attempts; other client errors (e.g. 404) are raised at once.
+
+        :param job_id: The ID of the job to check
+        :param wait: Long-poll wait passed through to get_status
+        :returns: API response containing current job status and details
+        :raises:
+            TranslationError: If every attempt fails with a transient error
+            aiohttp.ClientError: On non-retriable API communication failures
+        """
+        for attempt in range(self.config.max_retries):
+            try:
+                return await self.get_status(job_id, wait=wait)
+            except aiohttp.ClientResponseError as e:
+                if e.status < 500:
+                    raise
+                error = e
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                error = e
+            if attempt + 1 < self.config.max_retries:
+                delay = min(self.config.max_delay, self.config.min_delay * 2**attempt)
+                delay *= random.uniform(0.5, 1.5)
+                client_logger.warning(
+                    "Status check for job %s failed (%r), retrying in %.2fs",
+                    job_id,
+                    error,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+        raise TranslationError(
+            f"Error communicating with server after "
+            f"{self.config.max_retries} attempts: {error}"
+        ) from error
 
     async def wait_for_completion(self, job_id: str) -> Dict[str, Any]:
         """
@@ -170,49 +310,96 @@ class VideoTranslationClient:
         :returns: Final job status and results when complete
         :raises:
             TimeoutError: If job doesn't complete within base_timeout
-            TranslationError: If job fails or API communication fails
+            TranslationError: If job fails, is cancelled or API communication fails
 
         The polling behavior is controlled by the TranslationConfig settings:
+        - With long_poll, each request waits server-side up to max_delay seconds
+          for the job to finish and is reissued immediately; otherwise:
         - Starts with min_delay between checks
         - If status remains unchanged, progressively increases delay up to max_delay
         - Resets delay to min_delay when status changes
+        - Each delay is randomized by +/-20% so concurrent clients spread out
+        - Long-poll replies the server did not hold (job not processing) are
+          followed by the same delay
         - Gives up after base_timeout seconds
+        - Transient request failures are retried (see max_retries)
         """
-        # Setup initial variables for tracking job status polling
         client_logger.info(f"Starting to wait for job {job_id} completion.")
-        start_time = asyncio.get_event_loop().time()
-        current_delay = self.config.min_delay
+        try:
+            # fail_after cancels whatever is in flight (request or sleep) once
+            # base_timeout has passed, so the deadline is never overshot
+            with anyio.fail_after(self.config.base_timeout) as scope:
+                return await self._poll_until_done(job_id, scope)
+        except TimeoutError:
+            client_logger.error(
+                f"Job {job_id} did not complete within "
+                f"{self.config.base_timeout} seconds"
+            )
+            raise TimeoutError(
+                f"Job {job_id} did not complete within "
+                f"{self.config.base_timeout} seconds"
+            ) from None
+        finally:
+            # Forget the cached status so abandoned jobs don't accumulate
+            self._last_status.pop(job_id, None)
+
+    async def _poll_until_done(
+        self, job_id: str, scope: anyio.CancelScope
+    ) -> Dict[str, Any]:
+        """
+        Poll a job's status until it completes or fails.
+
+        Runs without a deadline of its own; wait_for_completion bounds it
+        with a cancel scope, whose deadline also caps each long-poll wait.
+
+        :param job_id: The ID of the job to monitor
+        :param scope: Cancel scope enforcing the overall timeout
+        :returns: Final job status and results when complete
+        :raises:
+            TranslationError: If job fails or API communication fails
+        """
+        # Setup initial variables for tracking job status polling
+        debug_on = client_logger.isEnabledFor(logging.DEBUG)
+        # Read the polling settings once rather than on every iteration
+        min_delay = self.config.min_delay
+        max_delay = self.config.max_delay
+        progressive = self.config.progressive_delay
+        long_poll = self.config.long_poll
+        current_delay = min_delay
         last_status = None
         consecutive_unchanged = 0
 
-        # Loop until the elapsed time exceeds the base timeout
-        while asyncio.get_event_loop().time() - start_time < self.config.base_timeout:
+        while True:
+            remaining = scope.deadline - anyio.current_time()
             try:
-                client_logger.debug(f"Checking status for job {job_id}...")
+                if debug_on:
+                    client_logger.debug("Checking status for job %s...", job_id)
 
-                status = await self.get_status(
-                    job_id
+                status = await self._get_status_retry(
+                    job_id,
+                    wait=(min(max_delay, remaining) if long_poll else 0),
                 )  # Asynchronously get the status of the job
 
-                client_logger.debug(f"Received status: {status}")
+                if debug_on:
+                    client_logger.debug("Received status: %s", status)
 
                 # Check if the status has changed since the last check
                 if status["status"] != last_status:
                     client_logger.info(f"Status changed: {status['status']}")
-                    current_delay = (
-                        self.config.min_delay
-                    )  # Reset the delay to the minimum delay
+                    current_delay = min_delay  # Reset the delay to the minimum delay
                     consecutive_unchanged = (
                         0  # Reset the counter for consecutive unchanged statuses
                     )
 
-                elif self.config.progressive_delay and consecutive_unchanged > 2:
-                    # If progressive delay is enabled and the status has been unchanged for more than 2 checks
-                    # Increase the delay, but do not exceed the maximum delay
-                    current_delay = min(current_delay * 1.5, self.config.max_delay)
-                    client_logger.debug(f"Increasing delay to {current_delay}")
-                    # Increment the counter for consecutive unchanged statuses
+                else:
+                    # Count every unchanged status; only the delay growth waits
+                    # until the status has been unchanged for more than 2 checks
                     consecutive_unchanged += 1
+                    if progressive and consecutive_unchanged > 2:
+                        # Increase the delay, but do not exceed the maximum delay
+                        current_delay = min(current_delay * 1.5, max_delay)
+                        if debug_on:
+                            client_logger.debug("Increasing delay to %s", current_delay)
                 # Update the last status to the current status
                 last_status = status["status"]
 
@@ -220,25 +407,23 @@ class VideoTranslationClient:
                 if status["status"] == "completed":
                     client_logger.info(f"Job {job_id} completed successfully.")
                     return status
-                elif status["status"] == "error":
+                elif status["status"] in ("error", "cancelled"):
                     error_message = status.get("error_message", "Unknown error")
                     client_logger.error(f"Translation failed: {error_message}")
                     raise TranslationError(f"Translation failed: {error_message}")
 
-                await asyncio.sleep(
-                    current_delay
-                )  # Wait for the current delay before checking the status again
+                # The server only holds long-poll requests while the job is
+                # processing; any other reply came back at once and needs a
+                # client-side delay so the loop doesn't spin
+                if not long_poll or status["status"] != "processing":
+                    # Wait for the current delay before checking the status
+                    # again; +/-20% jitter keeps concurrent pollers out of step
+                    await asyncio.sleep(current_delay * random.uniform(0.8, 1.2))
             except aiohttp.ClientError as e:
                 # If there is a client error, log the exception with traceback
                 client_logger.exception(f"Error communicating with server: {e}")
                 # Raise a TranslationError with the original exception
                 raise TranslationError(f"Error communicating with server: {e}") from e
-        client_logger.error(
-            f"Job {job_id} did not complete within {self.config.base_timeout} seconds"
-        )
-        raise TimeoutError(
-            f"Job {job_id} did not complete within {self.config.base_timeout} seconds"
-        )
 
     async def cancel_translation(self, job_id: str) -> Dict[str, Any]:
         """
@@ -252,9 +437,11 @@ class VideoTranslationClient:
         """
         try:
             async with self.session.post(
-                f"{self.base_url}/job/{job_id}/cancel", timeout=5
+                self._cancel_path(job_id), timeout=5
             ) as response:
                 response.raise_for_status()
-                return await response.json()
+                return orjson.loads(await response.read())
         except aiohttp.ClientError as e:
             raise TranslationError(f"Failed to cancel job: {e}") from e
+        finally:
+            self._last_status.pop(job_id, None)
@@ -0,0 +1,27 @@
+import logging
+
+"""
+    Shared logging setup for the client and server modules.
+"""
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+def get_logger(name: str, level: int = logging.INFO) -> logging.Logger:
+    """
+    Return a logger that writes to stderr in the project's log format.
+
+    The handler is only attached the first time a given logger is requested,
+    so importing a module more than once does not duplicate log lines.
+
+    :param name: Logger name, usually the calling module's ``__name__``
+    :param level: Logging level to set on the logger (default: INFO)
+    :returns: The configured logger
+    """
+    logger = logging.getLogger(name)
+    if not logger.handlers:
+        logger.setLevel(level)
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        logger.addHandler(handler)
+    return logger
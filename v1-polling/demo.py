@@ -1,7 +1,10 @@
 import asyncio
 import uvicorn
-import threading
-import time
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional (e.g. on Windows)
+    uvloop = None
 from server.app import app
 from client.client import VideoTranslationClient
 
@@ -13,7 +16,8 @@ from client.client import VideoTranslationClient
     It handles the lifecycle of both components and their interaction.
 
     Key Components:
-        - Threaded server execution using uvicorn
+        - In-process server execution using uvicorn on the same event loop,
+          which is uvloop when installed
         - Async client execution with proper lifecycle management
         - Coordinated startup sequence
         - Error handling and graceful shutdown
@@ -55,18 +59,26 @@ async def run_client():
             print(f"Error occurred: {e}")
 
 
-def run_server():
+async def start_server() -> tuple[uvicorn.Server, asyncio.Task]:
     """
-    Launch the translation server using uvicorn.
+    Launch the translation server on the running event loop.
 
-    Starts the FastAPI server application with uvicorn ASGI server
-    using the specified host and port configuration.
+    Starts the FastAPI server application with uvicorn as a background task
+    and returns once it is accepting connections, rather than sleeping for a
+    fixed time.
 
-    :returns: None
+    :returns: The running uvicorn server and the task serving it
     :raises:
         RuntimeError: If server fails to start or encounters errors
     """
-    uvicorn.run(app, host="127.0.0.1", port=8000)
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=8000))
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        if server_task.done():
+            server_task.result()
+            raise RuntimeError("Server exited during startup")
+        await asyncio.sleep(0.01)
+    return server, server_task
 
 
 async def main():
@@ -74,31 +86,28 @@ async def main():
     Coordinate server and client execution.
 
     This function manages the complete system lifecycle:
-        1. Starts server in a daemon thread
-        2. Waits for server initialization
+        1. Starts server as a task on the current event loop
+        2. Waits until the server is accepting connections
         3. Executes client workflow
-        4. Handles cleanup
-
-    The server thread is marked as daemon to ensure it's terminated
-    when the main program exits.
+        4. Shuts the server down
 
     :returns: None
     :raises:
         RuntimeError: If system coordination fails
         Exception: For any component-level failures
     """
-    # Initialize server in separate thread
-    server_thread = threading.Thread(target=run_server)
-    server_thread.daemon = True  # Ensure thread terminates with main program
-    server_thread.start()
-
-    # Allow server initialization time
-    time.sleep(2)
-
-    # Execute client workflow
-    await run_client()
+    server, server_task = await start_server()
+    try:
+        # Execute client workflow
+        await run_client()
+    finally:
+        server.should_exit = True
+        await server_task
 
 
 if __name__ == "__main__":
-    # Execute the coordinated system workflow
-    asyncio.run(main())
+    # Execute the coordinated system workflow; uvicorn serves on this loop,
+    # so uvloop has to be chosen here rather than through uvicorn's options
+    loop_factory = uvloop.new_event_loop if uvloop else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(main())
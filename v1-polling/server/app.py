@@ -1,12 +1,12 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Header, HTTPException, Query, Response
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from datetime import datetime
-import threading
 import random
-import logging
+import time
+from common.logging import get_logger
 from typing import Optional
 import asyncio
-import logging
+from cachetools import TTLCache
 
 """
     An asynchronous server for managing translation jobs.
@@ -15,14 +15,16 @@ import logging
     to mimic real-world translation service behavior. It provides a REST API for
     job submission and status monitoring.
 
-    The server maintains thread-safe job storage and implements configurable
-    processing times and error rates for testing and simulation purposes.
+    Job state lives in plain dicts owned by the event loop, with a per-job
+    asyncio.Event signalled when a job finishes. The server also implements
+    configurable processing times and error rates for testing and simulation
+    purposes.
 
     Key Components:
         - RESTful API endpoints for job management
         - Async job processing with random completion times
         - Configurable error rate simulation
-        - Thread-safe job storage
+        - Event-signalled job storage for long-polling
         - Comprehensive logging system
 
     :param logging_level: Logging level for the server (defaults to INFO)
@@ -33,14 +35,9 @@ import logging
 """
 
 # Configure logging for the server
-server_logger = logging.getLogger(__name__)
-server_logger.setLevel(logging.INFO)
-handler = logging.StreamHandler()
-formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-handler.setFormatter(formatter)
-server_logger.addHandler(handler)
+server_logger = get_logger(__name__)
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 
 class TranslationJob(BaseModel):
@@ -53,7 +50,7 @@ class TranslationJob(BaseModel):
     :param status: Current job status ('processing', 'completed', or 'error')
     :param source_language: Source language code
     :param target_language: Target language code
-    :param created_at: Timestamp when the job was created
+    :param created_at: Creation time in nanoseconds since the Unix epoch
     :param error_message: Error details if job failed, None otherwise
     """
 
@@ -61,7 +58,7 @@ class TranslationJob(BaseModel):
     status: str
     source_language: str
     target_language: str
-    created_at: datetime
+    created_at: int
     error_message: Optional[str] = None
 
 
@@ -73,21 +70,38 @@ class TranslationServer:
     with simulated processing times and configurable error rates.
 
     :param error_rate: Probability of random translation errors (0.0 to 1.0)
+    :param max_concurrent: Maximum number of jobs processed at once
 
     Raises:
         RuntimeError: When job storage operations fail
         Exception: When translation processing fails
     """
 
-    def __init__(self, error_rate=0.05):
+    def __init__(self, error_rate=0.05, ttl=3600, maxsize=10_000, max_concurrent=256):
         """
         Initialize the translation server.
 
+        Jobs still processing are kept until they finish; finished jobs move to
+        a cache that drops them after ``ttl`` seconds or once ``maxsize`` of
+        them are held, so memory stays bounded on long-running servers.
+
         :param error_rate: Probability of random translation errors (default: 0.05)
+        :param ttl: Seconds a finished job stays retrievable (default: 3600)
+        :param maxsize: Maximum number of finished jobs kept (default: 10000)
+        :param max_concurrent: Jobs processed at once; the rest queue on a
+            semaphore and stay "processing" until a slot frees (default: 256)
         """
-        self.jobs = {}
+        self.active = {}
+        self.done = TTLCache(maxsize=maxsize, ttl=ttl)
+        # Set once a job leaves "processing"; lets status requests long-poll
+        self._events = {}
+        # Processing task per active job, so cancellation can stop it
+        self.tasks = {}
+        self._sem = asyncio.Semaphore(max_concurrent)
         self.error_rate = error_rate
-        self._lock = threading.Lock()
+        # Own generator for simulated delays and errors, independent of the
+        # module-level random state
+        self._rng = random.Random()
 
     def start_processing(self, job_id: str):
         """
@@ -102,26 +116,37 @@ class TranslationServer:
             RuntimeError: When job storage access fails
         """
 
+        job = self.active[job_id]
+
         async def process():
             server_logger.info(f"Starting processing for job: {job_id}")
             try:
-                # Simulate processing time between 5 and 15 seconds
-                processing_time = random.uniform(5, 15)
-                await asyncio.sleep(processing_time)
+                async with self._sem:
+                    # Simulate processing time between 5 and 15 seconds
+                    processing_time = self._rng.uniform(5, 15)
+                    await asyncio.sleep(processing_time)
 
-                # Simulate random translation errors
-                if random.random() < self.error_rate:
-                    raise Exception("Random translation error occurred")
+                    # Simulate random translation errors
+                    if self._rng.random() < self.error_rate:
+                        raise Exception("Random translation error occurred")
 
-                self.jobs[job_id].status = "completed"
+                job.status = "completed"
                 server_logger.info(f"Job {job_id} completed successfully.")
 
+            except asyncio.CancelledError:
+                job.status = "cancelled"
+                job.error_message = "Job cancelled by user request"
+                raise
+
             except Exception as e:
                 server_logger.exception(f"Error processing job {job_id}: {e}")
-                self.jobs[job_id].status = "error"
-                self.jobs[job_id].error_message = str(e)
+                job.status = "error"
+                job.error_message = str(e)
 
-        asyncio.create_task(process())
+            finally:
+                self._finish(job_id)
+
+        self.tasks[job_id] = asyncio.create_task(process())
 
     def create_job(
         self, job_id: str, source_lang: str, target_lang: str
@@ -141,11 +166,28 @@ class TranslationServer:
             status="processing",
             source_language=source_lang,
             target_language=target_lang,
-            created_at=datetime.utcnow(),
+            created_at=time.time_ns(),
         )
-        self.jobs[job_id] = job
+        self.active[job_id] = job
+        self._events[job_id] = asyncio.Event()
         return job
 
+    def _finish(self, job_id: str):
+        """
+        Move a job out of the active set and wake anyone waiting on it.
+
+        Safe to call more than once for the same job.
+
+        :param job_id: Identifier of the job that left "processing"
+        """
+        self.tasks.pop(job_id, None)
+        job = self.active.pop(job_id, None)
+        if job is not None:
+            self.done[job_id] = job
+        event = self._events.pop(job_id, None)
+        if event is not None:
+            event.set()
+
     def get_job(self, job_id: str) -> Optional[TranslationJob]:
         """
         Retrieve a job by its identifier.
@@ -153,22 +195,61 @@ class TranslationServer:
         :param job_id: Identifier of the job to retrieve
         :returns: TranslationJob if found, None otherwise
         """
-        return self.jobs.get(job_id)
+        job = self.active.get(job_id)
+        if job is None:
+            job = self.done.get(job_id)
+        return job
+
+    async def wait(self, job_id: str, timeout: float) -> None:
+        """
+        Wait until a job leaves the "processing" state or the timeout expires.
 
-    def cancel_job(self, job_id: str) -> Optional[TranslationJob]:
+        :param job_id: Identifier of the job to wait for
+        :param timeout: Maximum time to wait in seconds
+        """
+        event = self._events.get(job_id)
+        if event is None or timeout <= 0:
+            return
+        try:
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def cancel_job(
+        self, job_id: str, timeout: float = 2.0
+    ) -> Optional[TranslationJob]:
         """
         Cancel a running translation job.
 
+        Cancels the job's processing task and waits up to ``timeout`` seconds
+        for it to stop, so cancelled jobs don't keep running in the background.
+
         :param job_id: Identifier of the job to cancel
+        :param timeout: Maximum time to wait for the processing task to stop
         :returns: Updated TranslationJob if found and cancelled, None otherwise
         """
         job = self.get_job(job_id)
-        if job and job.status == "processing":
+        if not job or job.status != "processing":
+            return None
+
+        task = self.tasks.get(job_id)
+        if task is not None:
+            task.cancel()
+            _, pending = await asyncio.wait({task}, timeout=timeout)
+            if pending:
+                server_logger.warning(
+                    f"Job {job_id} did not stop within {timeout} seconds"
+                )
+        if job.status == "processing":
             job.status = "cancelled"
             job.error_message = "Job cancelled by user request"
-            server_logger.info(f"Job {job_id} cancelled")
-            return job
-        return None
+            self._finish(job_id)
+        elif job.status != "cancelled":
+            # Finished before the cancellation took effect
+            return None
+
+        server_logger.info(f"Job {job_id} cancelled")
+        return job
 
 
 # Create singleton server instance
@@ -190,14 +271,19 @@ class TranslationRequest(BaseModel):
 
 
 @app.post("/translate")
-async def translate(request: TranslationRequest):
+async def translate(request: TranslationRequest, wait: float = Query(0, ge=0, le=30)):
     """
     Endpoint to submit a new translation job.
 
     Creates a new translation job and begins asynchronous processing.
+    With ``wait`` set, the request is held open until the job finishes or
+    ``wait`` seconds pass and the job record is returned, so quick jobs need
+    no status polling at all.
 
     :param request: Translation request containing job details
-    :returns: Dictionary containing job ID and status message
+    :param wait: Seconds to wait for the job to finish before responding
+    :returns: Dictionary containing job ID and status message, or the job
+              status and details when ``wait`` is set
     :raises:
         HTTPException: If job creation or processing fails
         RuntimeError: If server operations fail
@@ -208,26 +294,74 @@ async def translate(request: TranslationRequest):
         )
         server.start_processing(request.job_id)
         server_logger.info(f"Translation started for job id: {request.job_id}")
-        return {"message": "Translation started", "job_id": request.job_id}
     except Exception as e:
         server_logger.exception(f"Error starting translation: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+    if wait:
+        await server.wait(request.job_id, wait)
+        return job
+    return {"message": "Translation started", "job_id": request.job_id}
+
 
 @app.get("/job/{job_id}")
-async def get_job_status(job_id: str):
+async def get_job_status(
+    job_id: str,
+    response: Response,
+    wait: float = Query(0, ge=0, le=30),
+    if_none_match: Optional[str] = Header(None),
+):
     """
     Endpoint to check translation job status.
 
+    With ``wait`` set, the request is held open until the job finishes or
+    ``wait`` seconds pass, so clients need one request instead of many polls.
+
+    Responses carry a weak ETag derived from the job status. A request whose
+    ``If-None-Match`` header matches it gets an empty 304 response instead of
+    the job body.
+
     :param job_id: Identifier of the job to check
-    :returns: Current job status and details
+    :param response: Response used to set the ETag header
+    :param wait: Seconds to wait for the job to finish before responding
+    :param if_none_match: ETag of the status the client already has
+    :returns: Current job status and details, or 304 if unchanged
     :raises:
         HTTPException: If job is not found or status check fails
     """
-    server_logger.debug(f"Getting status for job: {job_id}")
+    server_logger.debug("Getting status for job: %s", job_id)
+    job = server.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job.status == "processing":
+        await server.wait(job_id, wait)
+    etag = f'W/"{job.status}"'
+    if if_none_match == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return job
+
+
+@app.get("/job/{job_id}/wait")
+async def wait_for_job(job_id: str, timeout: float = Query(20, gt=0, le=30)):
+    """
+    Endpoint to wait for a translation job to finish.
+
+    Holds the request open until the job leaves "processing" or ``timeout``
+    seconds pass, then returns the job. Equivalent to
+    ``GET /job/{job_id}?wait=...`` with a 20 second default.
+
+    :param job_id: Identifier of the job to wait for
+    :param timeout: Maximum seconds to wait before responding
+    :returns: Current job status and details
+    :raises:
+        HTTPException: If job is not found
+    """
     job = server.get_job(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
+    if job.status == "processing":
+        await server.wait(job_id, timeout)
     return job
 
 
@@ -242,7 +376,7 @@ async def cancel_job(job_id: str):
         HTTPException: If job is not found or cannot be cancelled
     """
     server_logger.info(f"Attempting to cancel job: {job_id}")
-    job = server.cancel_job(job_id)
+    job = await server.cancel_job(job_id)
     if not job:
         raise HTTPException(
             status_code=404, detail="Job not found or already completed/cancelled"
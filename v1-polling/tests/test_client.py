@@ -0,0 +1,211 @@
+import asyncio
+import aiohttp
+import pytest
+from yarl import URL
+from client import client as client_module
+from client.client import (
+    TranslationConfig,
+    TranslationError,
+    VideoTranslationClient,
+)
+
+
+@pytest.mark.asyncio
+async def test_progressive_delay_grows_while_status_unchanged(monkeypatch):
+    """Polling delay grows geometrically once the status stops changing"""
+    config = TranslationConfig(
+        base_timeout=30,
+        min_delay=0.5,
+        max_delay=3.0,
+        progressive_delay=True,
+        long_poll=False,
+    )
+    client = VideoTranslationClient("http://localhost:8000", config)
+    statuses = ["processing"] * 8 + ["completed"]
+    delays = []
+
+    async def fake_get_status(job_id, wait=0):
+        return {"job_id": job_id, "status": statuses.pop(0)}
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(client, "get_status", fake_get_status)
+    monkeypatch.setattr(client_module.asyncio, "sleep", fake_sleep)
+    # Take the jitter out so the backoff schedule is exact
+    monkeypatch.setattr(client_module.random, "uniform", lambda a, b: 1.0)
+
+    result = await client.wait_for_completion("job-1")
+
+    assert result["status"] == "completed"
+    # First poll sees a new status; growth starts after 3 unchanged polls
+    assert delays[:3] == [0.5, 0.5, 0.5]
+    assert delays[3:6] == pytest.approx([0.75, 1.125, 1.6875])
+    assert delays[-1] == config.max_delay
+
+
+@pytest.mark.asyncio
+async def test_long_poll_waits_server_side_without_sleeping(monkeypatch):
+    """Long-poll requests carry the wait time and skip client-side sleeps"""
+    client = VideoTranslationClient("http://localhost:8000", TranslationConfig())
+    statuses = ["processing", "processing", "completed"]
+    waits = []
+
+    async def fake_get_status(job_id, wait=0):
+        waits.append(wait)
+        return {"job_id": job_id, "status": statuses.pop(0)}
+
+    async def fake_sleep(delay):
+        raise AssertionError("long-poll client should not sleep between polls")
+
+    monkeypatch.setattr(client, "get_status", fake_get_status)
+    monkeypatch.setattr(client_module.asyncio, "sleep", fake_sleep)
+
+    result = await client.wait_for_completion("job-1")
+
+    assert result["status"] == "completed"
+    assert waits == [client.config.max_delay] * 3
+
+
+@pytest.mark.asyncio
+async def test_transient_status_errors_are_retried(monkeypatch):
+    """Dropped connections are retried with backoff instead of failing the job"""
+    client = VideoTranslationClient("http://localhost:8000", TranslationConfig())
+    responses = [
+        aiohttp.ServerDisconnectedError(),
+        aiohttp.ServerDisconnectedError(),
+        {"job_id": "job-1", "status": "completed"},
+    ]
+    delays = []
+
+    async def fake_get_status(job_id, wait=0):
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(client, "get_status", fake_get_status)
+    monkeypatch.setattr(client_module.asyncio, "sleep", fake_sleep)
+
+    result = await client.wait_for_completion("job-1")
+
+    assert result["status"] == "completed"
+    assert len(delays) == 2
+    assert 0.25 <= delays[0] <= 0.75 and 0.5 <= delays[1] <= 1.5
+
+
+@pytest.mark.asyncio
+async def test_client_errors_are_not_retried(monkeypatch):
+    """A 4xx response fails straight away"""
+    client = VideoTranslationClient("http://localhost:8000", TranslationConfig())
+    calls = []
+
+    async def fake_get_status(job_id, wait=0):
+        calls.append(job_id)
+        url = URL(f"http://localhost:8000/job/{job_id}")
+        request_info = aiohttp.RequestInfo(url, "GET", {}, url)
+        raise aiohttp.ClientResponseError(request_info, (), status=404)
+
+    monkeypatch.setattr(client, "get_status", fake_get_status)
+
+    with pytest.raises(TranslationError):
+        await client.wait_for_completion("job-1")
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_poll_delays_are_jittered(monkeypatch):
+    """Sleeps between polls vary within +/-20% of the scheduled delay"""
+    config = TranslationConfig(min_delay=1.0, progressive_delay=False, long_poll=False)
+    client = VideoTranslationClient("http://localhost:8000", config)
+    statuses = ["processing"] * 20 + ["completed"]
+    delays = []
+
+    async def fake_get_status(job_id, wait=0):
+        return {"job_id": job_id, "status": statuses.pop(0)}
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(client, "get_status", fake_get_status)
+    monkeypatch.setattr(client_module.asyncio, "sleep", fake_sleep)
+
+    await client.wait_for_completion("job-1")
+
+    assert all(0.8 <= delay <= 1.2 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+@pytest.mark.asyncio
+async def test_timeout_cancels_in_flight_request(monkeypatch):
+    """base_timeout interrupts a hung status request rather than waiting it out"""
+    config = TranslationConfig(base_timeout=0.1)
+    client = VideoTranslationClient("http://localhost:8000", config)
+
+    async def hung_get_status(job_id, wait=0):
+        await asyncio.sleep(60)
+
+    monkeypatch.setattr(client, "get_status", hung_get_status)
+
+    with pytest.raises(TimeoutError, match="did not complete within"):
+        await asyncio.wait_for(client.wait_for_completion("job-1"), timeout=5)
+
+
+@pytest.mark.asyncio
+async def test_timeout_forgets_cached_status(monkeypatch):
+    """A job abandoned on timeout leaves no cached ETag status behind"""
+    config = TranslationConfig(base_timeout=0.1, long_poll=False, min_delay=0.01)
+    client = VideoTranslationClient("http://localhost:8000", config)
+
+    async def processing_status(job_id, wait=0):
+        status = {"job_id": job_id, "status": "processing"}
+        client._last_status[job_id] = ('"etag-1"', status)
+        return status
+
+    monkeypatch.setattr(client, "get_status", processing_status)
+
+    with pytest.raises(TimeoutError):
+        await client.wait_for_completion("job-1")
+    assert "job-1" not in client._last_status
+
+
+@pytest.mark.asyncio
+async def test_cancelled_job_stops_polling(monkeypatch):
+    """A cancelled job raises after one request instead of being re-polled"""
+    client = VideoTranslationClient("http://localhost:8000", TranslationConfig())
+    requests = []
+
+    async def cancelled_status(job_id, wait=0):
+        requests.append(wait)
+        return {
+            "job_id": job_id,
+            "status": "cancelled",
+            "error_message": "Job cancelled by user request",
+        }
+
+    monkeypatch.setattr(client, "get_status", cancelled_status)
+
+    with pytest.raises(TranslationError, match="cancelled by user"):
+        await client.wait_for_completion("job-1")
+    assert len(requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_long_poll_sleeps_after_unheld_reply(monkeypatch):
+    """Statuses the server does not hold are re-polled after a delay, not at once"""
+    config = TranslationConfig(base_timeout=0.2, min_delay=0.05, max_delay=0.1)
+    client = VideoTranslationClient("http://localhost:8000", config)
+    requests = []
+
+    async def queued_status(job_id, wait=0):
+        requests.append(wait)
+        return {"job_id": job_id, "status": "queued"}
+
+    monkeypatch.setattr(client, "get_status", queued_status)
+
+    with pytest.raises(TimeoutError):
+        await client.wait_for_completion("job-1")
+    assert len(requests) <= 5
@@ -1,6 +1,6 @@
+import asyncio
 import pytest
-import threading
-import time
+import pytest_asyncio
 import uvicorn
 from server.app import app
 from client.client import VideoTranslationClient
@@ -11,15 +11,19 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-@pytest.fixture(scope="module")
-def server_fixture():
-    server_thread = threading.Thread(
-        target=lambda: uvicorn.run(app, host="127.0.0.1", port=8000)
-    )
-    server_thread.daemon = True
-    server_thread.start()
-    time.sleep(2)
-    yield
+@pytest_asyncio.fixture
+async def server_fixture():
+    """Serve the app on the test's event loop and yield its base URL"""
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=0))
+    task = asyncio.create_task(server.serve())
+    while not server.started:
+        if task.done():
+            task.result()  # Surface startup failures instead of spinning
+        await asyncio.sleep(0.01)
+    port = server.servers[0].sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}"
+    server.should_exit = True
+    await task
 
 
 @pytest.mark.asyncio
@@ -27,7 +31,7 @@ async def test_translation_flow(server_fixture):
     """Simple integration test demonstrating the translation service"""
     logger.info("Starting translation test")
 
-    async with VideoTranslationClient("http://localhost:8000") as client:
+    async with VideoTranslationClient(server_fixture) as client:
         # Start a translation job
         logger.info("Starting a translation job")
         response = await client.start_translation("en", "es")
@@ -0,0 +1,72 @@
+import asyncio
+import pytest
+from fastapi.testclient import TestClient
+from server.app import TranslationServer, app, server
+
+
+def test_finished_jobs_are_bounded():
+    """Finished jobs move to a size-bounded cache; the oldest get evicted"""
+    server = TranslationServer(maxsize=2)
+    for job_id in ("job-1", "job-2", "job-3"):
+        server.create_job(job_id, "en", "es")
+        server._finish(job_id)
+
+    assert server.active == {}
+    assert server.get_job("job-1") is None
+    assert server.get_job("job-3").job_id == "job-3"
+
+
+@pytest.mark.asyncio
+async def test_cancel_stops_processing_task():
+    """Cancelling a job tears down its processing task"""
+    server = TranslationServer(error_rate=0)
+    server.create_job("job-1", "en", "es")
+    server.start_processing("job-1")
+    task = server.tasks["job-1"]
+
+    job = await server.cancel_job("job-1")
+
+    assert job.status == "cancelled"
+    assert task.cancelled()
+    assert server.tasks == {} and server.active == {}
+    assert await server.cancel_job("job-1") is None
+
+
+@pytest.mark.asyncio
+async def test_processing_concurrency_is_bounded():
+    """Jobs beyond max_concurrent wait for a slot instead of running"""
+    server = TranslationServer(error_rate=0, max_concurrent=1)
+    for job_id in ("job-1", "job-2"):
+        server.create_job(job_id, "en", "es")
+        server.start_processing(job_id)
+    await asyncio.sleep(0)
+
+    assert server._sem.locked()
+    job = await server.cancel_job("job-2")
+    assert job.status == "cancelled"
+    await server.cancel_job("job-1")
+
+
+def test_status_etag_short_circuits_unchanged_polls():
+    """A poll carrying the current ETag gets an empty 304"""
+    server.create_job("etag-job", "en", "es")
+    client = TestClient(app)
+
+    first = client.get("/job/etag-job")
+    etag = first.headers["ETag"]
+    second = client.get("/job/etag-job", headers={"If-None-Match": etag})
+
+    assert first.status_code == 200 and first.json()["status"] == "processing"
+    assert second.status_code == 304 and second.content == b""
+    server._finish("etag-job")
+
+
+def test_wait_endpoint_returns_finished_job():
+    """The wait endpoint answers at once for a job that already finished"""
+    job = server.create_job("wait-job", "en", "es")
+    job.status = "completed"
+    server._finish("wait-job")
+
+    response = TestClient(app).get("/job/wait-job/wait")
+
+    assert response.status_code == 200 and response.json()["status"] == "completed"
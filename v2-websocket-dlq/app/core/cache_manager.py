@@ -1,8 +1,9 @@
 import redis.asyncio as redis
-import json
+import orjson
 import logging
 from typing import Optional
 from ..models.schemas import TranslationJob
+from .redis_pool import get_redis_pool
 
 logger = logging.getLogger(__name__)
 
@@ -25,34 +26,91 @@ class CacheManager:
         cache_ttl: Time-to-live for cached entries in seconds (3600)
     """
 
-    def __init__(self, redis_url: str = "redis://localhost:6379/1"):
+    def __init__(
+        self,
+        redis_url: str = "redis://localhost:6379/1",
+        connection_pool: Optional[redis.ConnectionPool] = None,
+    ):
         """Initialize Redis cache manager.
 
         Args:
             redis_url: Redis connection URL (default: "redis://localhost:6379/1")
+            connection_pool: Pool to draw connections from; defaults to the
+                shared pool for redis_url (see get_redis_pool)
         """
-        self.redis = redis.from_url(redis_url)
+        self.redis = redis.Redis(
+            connection_pool=connection_pool or get_redis_pool(redis_url)
+        )
         self.cache_prefix = "job_status:"
         self.cache_ttl = 3600  # 1 hour
 
-    async def cache_job_status(self, job: TranslationJob) -> None:
+    def _key(self, job_id: str) -> str:
+        """Build the Redis key for a job's cached status.
+
+        Args:
+            job_id: ID of the translation job
+
+        Returns:
+            Namespaced cache key
+        """
+        return self.cache_prefix + job_id
+
+    async def cache_job_status(self, job: TranslationJob) -> bytes:
         """Store translation job status in Redis cache.
 
-        Caches the serialized job data with automatic expiration after cache_ttl seconds.
+        Caches the job's status frame (see TranslationJob.status_json_bytes) with
+        automatic expiration after cache_ttl seconds, so cached results reach
+        websocket clients in the same shape as live pushes.
 
         Args:
             job: TranslationJob instance to cache
+
+        Returns:
+            The serialized JSON bytes, so callers can send them on without
+            encoding the job again (returned even if the cache write fails)
         """
-        key = f"{self.cache_prefix}{job.job_id}"
+        key = self._key(job.job_id)
+        payload = job.status_json_bytes()
         try:
-            await self.redis.setex(key, self.cache_ttl, job.model_dump_json())
+            await self.redis.setex(key, self.cache_ttl, payload)
         except Exception as e:
             logger.error(f"Error caching job status: {e}")
+        return payload
+
+    async def _get_cached_bytes(self, job_id: str) -> Optional[bytes]:
+        """Fetch the raw cached job status bytes.
+
+        Args:
+            job_id: ID of the translation job
+
+        Returns:
+            Stored JSON bytes if found, None otherwise
+        """
+        try:
+            return await self.redis.get(self._key(job_id))
+        except Exception as e:
+            logger.error(f"Error getting cached status: {e}")
+            return None
+
+    async def get_cached_payload(self, job_id: str) -> Optional[str]:
+        """Retrieve cached job status as its serialized JSON text.
+
+        Lets callers forward the cached payload as-is without decoding it.
+
+        Args:
+            job_id: ID of the translation job
+
+        Returns:
+            JSON string of the job status if found, None otherwise
+        """
+        data = await self._get_cached_bytes(job_id)
+        return data.decode() if data else None
 
     async def get_cached_status(self, job_id: str) -> Optional[dict]:
         """Retrieve cached job status.
 
         Fetches and deserializes the cached job status data if available.
+        orjson parses the stored bytes directly, without decoding to str first.
 
         Args:
             job_id: ID of the translation job
@@ -60,10 +118,5 @@ class CacheManager:
         Returns:
             Deserialized job status dict if found, None otherwise
         """
-        key = f"{self.cache_prefix}{job_id}"
-        try:
-            data = await self.redis.get(key)
-            return json.loads(data) if data else None
-        except Exception as e:
-            logger.error(f"Error getting cached status: {e}")
-            return None
+        data = await self._get_cached_bytes(job_id)
+        return orjson.loads(data) if data else None
@@ -1,10 +1,10 @@
-from typing import Dict, Optional, Set
+from typing import Dict, List, Optional
+from cachetools import LRUCache
 from fastapi import WebSocket
 import asyncio
 import logging
 from ..models.schemas import JobStatus, TranslationJob
 from .dlq_manager import DLQManager
-import json
 
 logger = logging.getLogger(__name__)
 
@@ -24,24 +24,31 @@ class ConnectionManager:
         await manager.disconnect(job_id, websocket)
 
     Attributes:
-        _active_connections: Mapping of job IDs to sets of active WebSocket connections
-        _completed_jobs: Cache of completed translation jobs
-        _error_jobs: Cache of failed translation jobs
+        _active_connections: Mapping of job IDs to lists of active WebSocket connections
+        _terminal_payloads: Bounded LRU cache of the serialized JSON of
+            completed and failed translation jobs
         _lock: Asyncio lock for thread-safe operations
+        active_count: Number of currently registered WebSocket connections
         dlq_manager: Manager for handling missed job updates
     """
 
-    def __init__(self, dlq_manager: Optional[DLQManager] = None):
+    def __init__(
+        self,
+        dlq_manager: Optional[DLQManager] = None,
+        terminal_cache_size: int = 10_000,
+    ):
         """
         Initialize connection manager with optional DLQ manager.
 
         Args:
             dlq_manager: Custom DLQ manager instance, creates default if None
+            terminal_cache_size: Maximum number of finished jobs kept in memory;
+                older ones are still available from the DLQ results in Redis
         """
-        self._active_connections: Dict[str, Set[WebSocket]] = {}
-        self._completed_jobs: Dict[str, TranslationJob] = {}
-        self._error_jobs: Dict[str, TranslationJob] = {}
+        self._active_connections: Dict[str, List[WebSocket]] = {}
+        self._terminal_payloads: LRUCache = LRUCache(maxsize=terminal_cache_size)
         self._lock = asyncio.Lock()
+        self.active_count = 0
         self.dlq_manager = dlq_manager or DLQManager()
 
     async def connect(self, job_id: str, websocket: WebSocket):
@@ -61,24 +68,36 @@ class ConnectionManager:
         await websocket.accept()
 
         # First check if job is already completed
-        if completed_job := self.get_job_status(job_id):
-            await websocket.send_json(json.loads(completed_job.model_dump_json()))
+        if payload := self._terminal_payloads.get(job_id):
+            await websocket.send_text(payload)
             return
 
         # Check DLQ for stored result
-        if result := await self.dlq_manager.get_result(job_id):
-            await websocket.send_json(result)
+        if result := await self.dlq_manager.get_result_payload(job_id):
+            await websocket.send_text(result)
             return
 
         async with self._lock:
-            if job_id not in self._active_connections:
-                self._active_connections[job_id] = set()
-            self._active_connections[job_id].add(websocket)
-            logger.info(f"New connection registered for job {job_id}")
+            # The job may have finished while the DLQ was being checked, when
+            # this connection was not registered to receive the push yet.
+            # update_job_status records terminal payloads under this lock, so
+            # re-checking here closes that window.
+            payload = self._terminal_payloads.get(job_id)
+            if payload is None:
+                # Few clients watch a job, so a list beats a set for add/iterate
+                connections = self._active_connections.setdefault(job_id, [])
+                if websocket not in connections:
+                    connections.append(websocket)
+                    self.active_count += 1
+                logger.info(f"New connection registered for job {job_id}")
+
+        if payload is not None:
+            await websocket.send_text(payload)
+            return
 
-            # If job was in DLQ, remove it since we now have an active connection
-            if await self.dlq_manager.is_in_dlq(job_id):
-                await self.dlq_manager.remove_from_dlq(job_id)
+        # If job was in DLQ, remove it since we now have an active connection
+        if await self.dlq_manager.is_in_dlq(job_id):
+            await self.dlq_manager.remove_from_dlq(job_id)
 
     async def disconnect(self, job_id: str, websocket: WebSocket):
         """
@@ -93,15 +112,20 @@ class ConnectionManager:
             job_id: Unique identifier for the translation job
             websocket: WebSocket connection to remove
         """
+        orphaned = False
         async with self._lock:
-            if job_id in self._active_connections:
-                self._active_connections[job_id].discard(websocket)
-                if not self._active_connections[job_id]:
+            if connections := self._active_connections.get(job_id):
+                remaining = [c for c in connections if c is not websocket]
+                self.active_count -= len(connections) - len(remaining)
+                connections[:] = remaining
+                if not connections:
                     del self._active_connections[job_id]
-                    # If job has a result but no connections, add to DLQ
-                    if result := self.get_job_status(job_id):
-                        await self.dlq_manager.add_to_dlq(job_id)
-            logger.info(f"Connection removed for job {job_id}")
+                    orphaned = job_id in self._terminal_payloads
+        logger.info(f"Connection removed for job {job_id}")
+
+        # If job has a result but no connections, add to DLQ
+        if orphaned:
+            await self.dlq_manager.add_to_dlq(job_id)
 
     async def update_job_status(self, job: TranslationJob):
         """
@@ -117,41 +141,33 @@ class ConnectionManager:
         Args:
             job: Updated translation job instance
         """
+        # Only mutate shared state under the lock; all I/O happens outside it
+        # so a slow client or Redis round-trip can't stall other operations
+        # Serialize once; terminal payloads are also reused by later connects
+        payload = job.status_json()
+
         async with self._lock:
-            if job.status == JobStatus.COMPLETED:
-                self._completed_jobs[job.job_id] = job
-            elif job.status == JobStatus.ERROR:
-                self._error_jobs[job.job_id] = job
-
-            # Store result in Redis
-            await self.dlq_manager.store_result(job)
-
-            # Notify all waiting clients
-            if job.job_id in self._active_connections:
-                disconnected = set()
-                json_data = json.loads(job.model_dump_json())
-                for connection in self._active_connections[job.job_id]:
-                    try:
-                        await connection.send_json(json_data)
-                    except Exception as e:
-                        logger.error(f"Failed to send update to client: {e}")
-                        disconnected.add(connection)
-
-                # Clean up disconnected clients
-                for connection in disconnected:
-                    await self.disconnect(job.job_id, connection)
-            else:
-                # If no active connections, add to DLQ
-                await self.dlq_manager.add_to_dlq(job.job_id)
-
-    def get_job_status(self, job_id: str) -> Optional[TranslationJob]:
-        """
-        Retrieve current job status if completed or errored.
+            if job.status in (JobStatus.COMPLETED, JobStatus.ERROR):
+                self._terminal_payloads[job.job_id] = payload
 
-        Args:
-            job_id: Unique identifier for the translation job
+            targets = list(self._active_connections.get(job.job_id, ()))
 
-        Returns:
-            TranslationJob if found in completed or error cache, None otherwise
-        """
-        return self._completed_jobs.get(job_id) or self._error_jobs.get(job_id)
+        # Store result in Redis
+        await self.dlq_manager.store_result(job)
+
+        if not targets:
+            # If no active connections, add to DLQ
+            await self.dlq_manager.add_to_dlq(job.job_id)
+            return
+
+        # Notify all waiting clients concurrently
+        results = await asyncio.gather(
+            *(connection.send_text(payload) for connection in targets),
+            return_exceptions=True,
+        )
+
+        # Clean up disconnected clients
+        for connection, result in zip(targets, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to send update to client: {result}")
+                await self.disconnect(job.job_id, connection)
@@ -1,9 +1,12 @@
 import redis.asyncio as redis
-import json
 import logging
-from typing import Optional, List
+import orjson
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Optional, List
 from datetime import datetime, UTC
 from ..models.schemas import TranslationJob
+from .redis_pool import get_redis_pool
+from .write_buffer import WriteBehindBuffer
 
 logger = logging.getLogger(__name__)
 
@@ -16,27 +19,56 @@ class DLQManager:
     using Redis as a persistent store. Maintains both a set of DLQ job IDs and
     a hash of job results for recovery.
 
+    Job results are buffered in memory and written to Redis in batches, so a
+    burst of completions costs a single pipelined round-trip instead of one
+    per job. Buffered results are still visible to get_result().
+
     Example:
         dlq = DLQManager("redis://localhost:6379/0")
         await dlq.add_to_dlq(job_id)
         result = await dlq.get_result(job_id)
 
+        Several operations in one round-trip:
+        async with dlq.pipeline() as pipe:
+            pipe.add_to_dlq(job_id)
+            pipe.get_result(job_id)
+            added, result = await pipe.execute()
+
     Attributes:
         redis: Redis client connection
         dlq_key: Redis key for the DLQ set ("translation:dlq")
         results_key: Redis key for job results hash ("translation:results")
+        _buffer: Write-behind buffer batching result writes
     """
 
-    def __init__(self, redis_url: str = "redis://localhost:6379/0"):
+    def __init__(
+        self,
+        redis_url: str = "redis://localhost:6379/0",
+        batch_size: int = 100,
+        max_latency_ms: float = 10.0,
+        connection_pool: Optional[redis.ConnectionPool] = None,
+    ):
         """
         Initialize DLQ manager with Redis connection.
 
         Args:
             redis_url: Redis connection URL (default: "redis://localhost:6379/0")
+            batch_size: Buffered results that trigger an immediate flush
+            max_latency_ms: Maximum buffering delay for results in milliseconds
+            connection_pool: Pool to draw connections from; must decode
+                responses. Defaults to the shared decoding pool for redis_url
+                (see get_redis_pool)
         """
-        self.redis = redis.from_url(redis_url)
+        # Replies arrive as str, so IDs and results need no per-item decode
+        self.redis = redis.Redis(
+            connection_pool=connection_pool
+            or get_redis_pool(redis_url, decode_responses=True)
+        )
         self.dlq_key = "translation:dlq"
         self.results_key = "translation:results"
+        self._buffer = WriteBehindBuffer(
+            self._write_results, batch_size=batch_size, max_latency_ms=max_latency_ms
+        )
 
     async def add_to_dlq(self, job_id: str) -> None:
         """
@@ -93,30 +125,98 @@ class DLQManager:
 
     async def store_result(self, job: TranslationJob) -> None:
         """
-        Store job result data in Redis hash.
+        Queue job result data for storage in Redis hash.
 
-        Serializes job status, completion time, and error details to JSON
-        for persistent storage.
+        The result is buffered and written by a background flush once
+        batch_size results are pending or max_latency_ms has elapsed.
+        A newer result for the same job replaces a still-buffered one.
 
         Args:
             job: TranslationJob instance containing result data
+        """
+        self._buffer.add(job)
+
+    async def flush(self) -> None:
+        """
+        Write all buffered job results to Redis in a single HSET.
+
+        Raises:
+            Exception: If Redis operation fails
+        """
+        await self._buffer.flush()
+
+    async def aclose(self) -> None:
+        """
+        Stop background flushing and write all buffered results.
+
+        A batch already in flight is re-queued and written with the rest;
+        call this on shutdown before the connections to Redis are closed.
+
+        Raises:
+            Exception: If the final write fails
+        """
+        await self._buffer.aclose()
+
+    async def store_results_bulk(self, jobs: List[TranslationJob]) -> None:
+        """
+        Store results for several jobs with one multi-field HSET.
+
+        Writes straight to Redis, bypassing the write buffer; any buffered
+        result for these jobs is superseded.
+
+        Args:
+            jobs: TranslationJob instances containing result data
+
+        Raises:
+            Exception: If Redis operation fails
+        """
+        if not jobs:
+            return
+
+        for job in jobs:
+            self._buffer.discard(job.job_id)
+        await self._write_results(jobs)
+
+    async def _write_results(self, jobs: List[TranslationJob]) -> None:
+        """
+        Write results for several jobs with one multi-field HSET.
+
+        Args:
+            jobs: TranslationJob instances containing result data
+
+        Raises:
+            Exception: If Redis operation fails
+        """
+        mapping = {job.job_id: job.status_json_bytes() for job in jobs}
+        try:
+            await self.redis.hset(self.results_key, mapping=mapping)
+            logger.info(f"Stored results for {len(mapping)} jobs")
+        except Exception as e:
+            logger.error(f"Error storing results for {len(mapping)} jobs: {e}")
+            raise
+
+    async def get_result_payload(self, job_id: str) -> Optional[str]:
+        """
+        Retrieve job result data as its stored JSON text.
+
+        Lets callers forward the result as-is without decoding it.
+
+        Args:
+            job_id: ID of the job to retrieve
+
+        Returns:
+            JSON string of the job result if found, None otherwise
 
         Raises:
             Exception: If Redis operation fails
         """
+        if job := self._buffer.get(job_id):
+            return job.status_json()
+
         try:
-            result = {
-                "job_id": job.job_id,
-                "status": job.status,
-                "completed_at": (
-                    job.completed_at.isoformat() if job.completed_at else None
-                ),
-                "error_message": job.error_message,
-            }
-            await self.redis.hset(self.results_key, job.job_id, json.dumps(result))
-            logger.info(f"Stored result for job {job.job_id}")
+            return await self.redis.hget(self.results_key, job_id)
         except Exception as e:
-            logger.error(f"Error storing result for job {job.job_id}: {e}")
+            logger.error(f"Error getting result for job {job_id}: {e}")
             raise
 
     async def get_result(self, job_id: str) -> Optional[dict]:
@@ -129,16 +229,37 @@ class DLQManager:
         Returns:
             Dict containing job result data if found, None otherwise
 
+        Raises:
+            Exception: If Redis operation fails
+        """
+        result = await self.get_result_payload(job_id)
+        return orjson.loads(result) if result else None
+
+    @asynccontextmanager
+    async def pipeline(self) -> AsyncIterator["DLQPipeline"]:
+        """
+        Open a pipeline that sends several DLQ operations in one round-trip.
+
+        Yields:
+            DLQPipeline queuing commands until execute() is awaited
+        """
+        async with self.redis.pipeline(transaction=False) as pipe:
+            yield DLQPipeline(self, pipe)
+
+    async def dlq_size(self) -> int:
+        """
+        Count the jobs currently in the DLQ without fetching their IDs.
+
+        Returns:
+            Number of job IDs in the DLQ set
+
         Raises:
             Exception: If Redis operation fails
         """
         try:
-            result = await self.redis.hget(self.results_key, job_id)
-            if result:
-                return json.loads(result)
-            return None
+            return await self.redis.scard(self.dlq_key)
         except Exception as e:
-            logger.error(f"Error getting result for job {job_id}: {e}")
+            logger.error(f"Error getting DLQ size: {e}")
             raise
 
     async def get_dlq_jobs(self) -> List[str]:
@@ -152,7 +273,129 @@ class DLQManager:
             Exception: If Redis operation fails
         """
         try:
-            return [job.decode() for job in await self.redis.smembers(self.dlq_key)]
+            return list(await self.redis.smembers(self.dlq_key))
         except Exception as e:
             logger.error(f"Error getting DLQ jobs: {e}")
             raise
+
+    async def get_dlq_snapshot(self) -> Dict[str, Optional[dict]]:
+        """
+        Get every job ID in the DLQ together with its stored result.
+
+        Fetches all results with a single HMGET rather than one lookup per
+        job, so a recovery pass costs two round-trips regardless of DLQ size.
+
+        Returns:
+            Dict mapping each DLQ job ID to its result dict, or None if no
+            result is stored for it
+
+        Raises:
+            Exception: If Redis operation fails
+        """
+        job_ids = await self.get_dlq_jobs()
+        if not job_ids:
+            return {}
+        try:
+            results = await self.redis.hmget(self.results_key, job_ids)
+        except Exception as e:
+            logger.error(f"Error getting results for {len(job_ids)} DLQ jobs: {e}")
+            raise
+        snapshot = {}
+        for job_id, result in zip(job_ids, results):
+            if job := self._buffer.get(job_id):
+                snapshot[job_id] = orjson.loads(job.status_json_bytes())
+            else:
+                snapshot[job_id] = orjson.loads(result) if result else None
+        return snapshot
+
+
+def _discard(reply: Any) -> None:
+    """Drop the reply of a write command, matching DLQManager's None returns."""
+    return None
+
+
+class DLQPipeline:
+    """
+    Queues DLQ operations and runs them in a single Redis round-trip.
+
+    Mirrors the DLQManager methods, but each call only queues its command;
+    execute() sends them in order and returns the decoded results in the
+    same shape the corresponding DLQManager methods return. Results are
+    written straight to Redis, bypassing the manager's write buffer.
+
+    Attributes:
+        _manager: DLQManager providing the Redis keys and serialization
+        _pipe: Underlying Redis pipeline
+        _decoders: Per-command converters applied to the raw replies
+    """
+
+    def __init__(self, manager: DLQManager, pipe: Any):
+        """
+        Initialize pipeline for a DLQ manager.
+
+        Args:
+            manager: DLQManager the operations belong to
+            pipe: Open Redis pipeline to queue commands on
+        """
+        self._manager = manager
+        self._pipe = pipe
+        self._decoders: List[Callable[[Any], Any]] = []
+
+    def store_result(self, job: TranslationJob) -> None:
+        """Queue storing a job result (see DLQManager.store_result)."""
+        self._manager._buffer.discard(job.job_id)
+        self._pipe.hset(
+            self._manager.results_key,
+            job.job_id,
+            job.status_json_bytes(),
+        )
+        self._decoders.append(_discard)
+
+    def add_to_dlq(self, job_id: str) -> None:
+        """Queue adding a job ID to the DLQ (see DLQManager.add_to_dlq)."""
+        self._pipe.sadd(self._manager.dlq_key, job_id)
+        self._decoders.append(_discard)
+
+    def remove_from_dlq(self, job_id: str) -> None:
+        """Queue removing a job ID from the DLQ (see DLQManager.remove_from_dlq)."""
+        self._pipe.srem(self._manager.dlq_key, job_id)
+        self._decoders.append(_discard)
+
+    def is_in_dlq(self, job_id: str) -> None:
+        """Queue a DLQ membership check (see DLQManager.is_in_dlq)."""
+        self._pipe.sismember(self._manager.dlq_key, job_id)
+        self._decoders.append(bool)
+
+    def get_result(self, job_id: str) -> None:
+        """Queue a result lookup (see DLQManager.get_result)."""
+        self._pipe.hget(self._manager.results_key, job_id)
+        self._decoders.append(lambda result: orjson.loads(result) if result else None)
+
+    def get_dlq_jobs(self) -> None:
+        """Queue listing the DLQ (see DLQManager.get_dlq_jobs)."""
+        self._pipe.smembers(self._manager.dlq_key)
+        self._decoders.append(list)
+
+    def dlq_size(self) -> None:
+        """Queue counting the DLQ (see DLQManager.dlq_size)."""
+        self._pipe.scard(self._manager.dlq_key)
+        self._decoders.append(int)
+
+    async def execute(self) -> List[Any]:
+        """
+        Send all queued operations in one round-trip.
+
+        Returns:
+            Decoded result of each queued operation, in queue order
+
+        Raises:
+            Exception: If Redis operation fails
+        """
+        try:
+            replies = await self._pipe.execute()
+        except Exception as e:
+            logger.error(f"Error executing DLQ pipeline: {e}")
+            raise
+        finally:
+            decoders, self._decoders = self._decoders, []
+        return [decode(reply) for decode, reply in zip(decoders, replies)]
@@ -1,8 +1,9 @@
 import asyncio
 import random
+import time
 from datetime import datetime, UTC
 import logging
-from typing import Optional, Callable, Awaitable, List
+from typing import Optional, Callable, Awaitable, Dict, List
 from ..models.schemas import TranslationJob, JobStatus
 
 logger = logging.getLogger(__name__)
@@ -14,7 +15,9 @@ class JobProcessor:
 
     Provides a mock implementation of a translation processing system with configurable
     processing times and error rates. Supports callback registration for job status
-    updates and manages concurrent job processing.
+    updates and processes jobs on a fixed pool of worker coroutines fed by a
+    bounded queue, so bursts of submissions apply backpressure instead of
+    spawning unbounded tasks.
 
     Example:
         processor = JobProcessor(min_processing_time=5.0, error_rate=0.1)
@@ -24,13 +27,17 @@ class JobProcessor:
             print(f"Job {job.job_id} status: {job.status}")
 
         await processor.start_job(translation_job)
+        await processor.shutdown()
 
     Attributes:
         min_processing_time: Minimum processing duration in seconds
         max_processing_time: Maximum processing duration in seconds
         error_rate: Probability of job failure (0.0 to 1.0)
+        _rng: Processor-local random generator for simulated timings and failures
         _active_jobs: Dictionary of currently processing jobs
-        _update_callbacks: List of registered status update callback functions
+        _update_callbacks: Registered status update callbacks grouped by stage
+        _queue: Bounded queue of jobs waiting for a worker
+        _workers: Worker tasks draining the queue, started on first job
     """
 
     def __init__(
@@ -38,6 +45,9 @@ class JobProcessor:
         min_processing_time: float = 5.0,
         max_processing_time: float = 15.0,
         error_rate: float = 0.1,
+        seed: Optional[int] = None,
+        queue_maxsize: int = 1000,
+        workers: int = 100,
     ):
         """
         Initialize the job processor with configurable parameters.
@@ -46,19 +56,38 @@ class JobProcessor:
             min_processing_time: Minimum job processing time in seconds
             max_processing_time: Maximum job processing time in seconds
             error_rate: Probability of job failure (0.0 to 1.0)
+            seed: Optional seed for reproducible simulated timings and failures
+            queue_maxsize: Maximum number of jobs waiting for a worker
+            workers: Number of jobs processed concurrently
         """
         self.min_processing_time = min_processing_time
         self.max_processing_time = max_processing_time
         self.error_rate = error_rate
+        self._rng = random.Random(seed)
         self._active_jobs = {}
-        self._update_callbacks: List[Callable[[TranslationJob], Awaitable[None]]] = []
-
-    def on_job_update(self, callback: Callable[[TranslationJob], Awaitable[None]]):
+        self._update_callbacks: Dict[
+            int, List[Callable[[TranslationJob], Awaitable[None]]]
+        ] = {}
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=queue_maxsize)
+        self._worker_count = workers
+        self._workers: List[asyncio.Task] = []
+
+    def on_job_update(
+        self,
+        callback: Optional[Callable[[TranslationJob], Awaitable[None]]] = None,
+        *,
+        stage: int = 0,
+    ):
         """
         Decorator to register callback functions for job status updates.
 
+        Callbacks in the same stage run concurrently; stages run in ascending
+        order, so a callback that depends on another's side effects should be
+        registered in a later stage.
+
         Args:
             callback: Async function that takes a TranslationJob parameter
+            stage: Execution stage of the callback (default: 0)
 
         Returns:
             The registered callback function (for decorator usage)
@@ -67,39 +96,83 @@ class JobProcessor:
             @processor.on_job_update
             async def handle_update(job):
                 print(f"Job {job.job_id} updated")
+
+            @processor.on_job_update(stage=1)
+            async def after_update(job):
+                print(f"Job {job.job_id} fully processed")
         """
-        self._update_callbacks.append(callback)
-        return callback
+
+        def register(callback):
+            self._update_callbacks.setdefault(stage, []).append(callback)
+            return callback
+
+        if callback is None:
+            return register
+        return register(callback)
 
     async def _notify_update(self, job: TranslationJob):
         """
         Notify all registered callbacks of job status changes.
 
-        Executes all registered callbacks with the updated job instance.
-        Handles and logs any errors that occur during callback execution.
+        Executes all registered callbacks with the updated job instance,
+        running callbacks of the same stage concurrently. Handles and logs
+        any errors that occur during callback execution.
 
         Args:
             job: Updated TranslationJob instance
         """
-        for callback in self._update_callbacks:
-            try:
-                await callback(job)
-            except Exception as e:
-                logger.error(f"Error in job update callback: {e}")
+        for stage in sorted(self._update_callbacks):
+            results = await asyncio.gather(
+                *(callback(job) for callback in self._update_callbacks[stage]),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"Error in job update callback: {result}")
 
     async def start_job(self, job: TranslationJob) -> None:
         """
-        Begin processing a translation job asynchronously.
+        Queue a translation job for processing.
 
-        Creates a new processing task for the job and adds it to active jobs.
-        Processing occurs in the background while this method returns immediately.
+        Adds the job to active jobs and hands it to the worker pool. Returns
+        as soon as the job is queued; waits only while the queue is full.
 
         Args:
             job: TranslationJob instance to process
         """
         logger.info(f"Starting processing for job: {job.job_id}")
+        if not self._workers:
+            # Started lazily since the processor is built before the loop runs
+            self._workers = [
+                asyncio.create_task(self._worker()) for _ in range(self._worker_count)
+            ]
         self._active_jobs[job.job_id] = job
-        asyncio.create_task(self._process_job(job))
+        await self._queue.put(job)
+
+    async def _worker(self) -> None:
+        """
+        Process queued jobs one at a time until cancelled.
+        """
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._process_job(job)
+            except Exception as e:
+                logger.error(f"Unexpected error in job worker: {e}")
+            finally:
+                self._queue.task_done()
+
+    async def shutdown(self) -> None:
+        """
+        Wait for queued jobs to finish, then stop the worker pool.
+        """
+        if not self._workers:
+            return
+        await self._queue.join()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
 
     async def _process_job(self, job: TranslationJob) -> None:
         """
@@ -115,29 +188,37 @@ class JobProcessor:
         Args:
             job: TranslationJob instance to process
         """
+        started = time.monotonic()
         try:
-            # Simulate processing time
-            processing_time = random.uniform(
-                self.min_processing_time, self.max_processing_time
-            )
-            logger.info(f"Job {job.job_id} will take {processing_time:.2f} seconds")
-            await asyncio.sleep(processing_time)
+            try:
+                # Simulate processing time
+                processing_time = self._rng.uniform(
+                    self.min_processing_time, self.max_processing_time
+                )
+                logger.info(f"Job {job.job_id} will take {processing_time:.2f} seconds")
+                await asyncio.sleep(processing_time)
 
-            # Simulate random errors
-            if random.random() < self.error_rate:
-                raise Exception("Random translation error occurred")
+                # Simulate random errors
+                if self._rng.random() < self.error_rate:
+                    raise Exception("Random translation error occurred")
 
-            # Update job status
-            job.status = JobStatus.COMPLETED
-            job.completed_at = datetime.now(UTC)
-            logger.info(f"Job {job.job_id} completed successfully")
-            await self._notify_update(job)
+                # Update job status
+                job.status = JobStatus.COMPLETED
+                logger.info(f"Job {job.job_id} completed successfully")
 
-        except Exception as e:
-            logger.error(f"Error processing job {job.job_id}: {e}")
-            job.status = JobStatus.ERROR
-            job.error_message = str(e)
+            except Exception as e:
+                logger.error(f"Error processing job {job.job_id}: {e}")
+                job.status = JobStatus.ERROR
+                job.error_message = str(e)
+
+            # Single timestamp shared by both outcomes; durations use the
+            # monotonic clock so they are immune to wall-clock adjustments
             job.completed_at = datetime.now(UTC)
+            logger.debug(
+                "Job %s finished in %.2f seconds",
+                job.job_id,
+                time.monotonic() - started,
+            )
             await self._notify_update(job)
 
         finally:
@@ -1,6 +1,11 @@
 from prometheus_client import Counter, Histogram, Gauge
+from typing import Sequence
 import time
 
+# Job durations cluster around the configured 1-3s processing window;
+# Prometheus' default buckets would put nearly everything in one bucket
+DEFAULT_PROCESSING_BUCKETS = (0.5, 1, 1.5, 2, 2.5, 3, 4, 5, 7.5, 10, 30)
+
 
 class MetricsManager:
     """
@@ -26,12 +31,18 @@ class MetricsManager:
         dlq_size: Gauge for current size of Dead Letter Queue
     """
 
-    def __init__(self):
+    def __init__(
+        self, processing_buckets: Sequence[float] = DEFAULT_PROCESSING_BUCKETS
+    ):
         """
         Initialize Prometheus metrics collectors.
 
         Creates Counter, Histogram, and Gauge instances with appropriate
         names and descriptions for monitoring translation service behavior.
+
+        Args:
+            processing_buckets: Histogram bucket bounds for processing time
+                in seconds, tuned to the expected job duration range
         """
         # Counters
         self.job_created = Counter(
@@ -44,7 +55,9 @@ class MetricsManager:
 
         # Histograms
         self.processing_time = Histogram(
-            "translation_processing_seconds", "Time spent processing translations"
+            "translation_processing_seconds",
+            "Time spent processing translations",
+            buckets=processing_buckets,
         )
 
         # Gauges
@@ -92,6 +105,15 @@ class MetricsManager:
         """
         return self.processing_time.time()
 
+    def observe_processing_time(self, seconds: float):
+        """
+        Record the processing duration of a finished job.
+
+        Args:
+            seconds: Time between job creation and completion in seconds
+        """
+        self.processing_time.observe(seconds)
+
     def set_active_connections(self, count: int):
         """
         Update the active WebSocket connections gauge.
@@ -0,0 +1,72 @@
+import socket
+from typing import Dict, Tuple
+import redis.asyncio as redis
+
+# TCP keepalive probing for pooled connections: start after 60s idle, probe
+# every 10s, drop after 3 misses (only options the platform supports)
+_KEEPALIVE_OPTIONS = {
+    getattr(socket, name): value
+    for name, value in (
+        ("TCP_KEEPIDLE", 60),
+        ("TCP_KEEPINTVL", 10),
+        ("TCP_KEEPCNT", 3),
+    )
+    if hasattr(socket, name)
+}
+
+_pools: Dict[Tuple[str, int, int, bool], redis.ConnectionPool] = {}
+
+
+def get_redis_pool(
+    redis_url: str,
+    max_connections: int = 64,
+    health_check_interval: int = 30,
+    decode_responses: bool = False,
+) -> redis.ConnectionPool:
+    """
+    Return the shared connection pool for a Redis URL, creating it on first use.
+
+    Managers that talk to the same Redis URL share one pool, so connections
+    are reused across them instead of each opening its own. Pooled sockets use
+    TCP keepalive, and connections idle longer than health_check_interval are
+    PINGed before reuse, so half-open connections are detected early.
+
+    Example:
+        pool = get_redis_pool("redis://localhost:6379/0")
+        client = redis.Redis(connection_pool=pool)
+
+    Args:
+        redis_url: Redis connection URL
+        max_connections: Upper bound on open connections in the pool
+        health_check_interval: Idle seconds after which a connection is
+            checked before use
+        decode_responses: Return replies as str instead of bytes
+
+    Returns:
+        ConnectionPool shared by all callers with the same arguments
+    """
+    key = (redis_url, max_connections, health_check_interval, decode_responses)
+    if (pool := _pools.get(key)) is None:
+        pool = _pools[key] = redis.ConnectionPool.from_url(
+            redis_url,
+            max_connections=max_connections,
+            health_check_interval=health_check_interval,
+            socket_keepalive=True,
+            socket_keepalive_options=_KEEPALIVE_OPTIONS,
+            decode_responses=decode_responses,
+        )
+    return pool
+
+
+async def close_redis_pools() -> None:
+    """
+    Disconnect every shared pool and forget it.
+
+    Clients built on a shared pool do not own it, so closing them leaves the
+    sockets open; call this once on shutdown so reloads don't leak them.
+    A later get_redis_pool() call creates a fresh pool.
+    """
+    pools = list(_pools.values())
+    _pools.clear()
+    for pool in pools:
+        await pool.disconnect()
@@ -0,0 +1,156 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional
+from ..models.schemas import TranslationJob
+
+# Upper bound on the pause between retries of a failing batch
+_MAX_RETRY_DELAY = 1.0
+
+
+class WriteBehindBuffer:
+    """
+    Coalescing write-behind buffer for job updates.
+
+    Collects jobs in memory and hands them to a batch writer once batch_size
+    jobs are pending or max_latency_ms has elapsed, so a burst of updates
+    costs one backend round-trip instead of one per job. Only the latest
+    update per job is kept while it waits. A batch whose write fails is put
+    back (without replacing newer updates) and retried with backoff, so no
+    update is dropped because of a transient backend error.
+
+    Example:
+        buffer = WriteBehindBuffer(write_jobs)
+        buffer.add(job)
+        ...
+        await buffer.aclose()  # on shutdown
+
+    Attributes:
+        batch_size: Number of buffered jobs that triggers an immediate flush
+        max_latency_ms: Maximum time a job waits in the buffer before flushing
+        _write_batch: Coroutine function writing a list of jobs to the backend
+        _pending: Buffered jobs by job ID, in arrival order
+    """
+
+    def __init__(
+        self,
+        write_batch: Callable[[List[TranslationJob]], Awaitable[None]],
+        batch_size: int = 100,
+        max_latency_ms: float = 10.0,
+    ):
+        """
+        Initialize the buffer.
+
+        Args:
+            write_batch: Coroutine function writing a batch of jobs; it should
+                log and raise on failure
+            batch_size: Buffered jobs that trigger an immediate flush
+            max_latency_ms: Maximum buffering delay in milliseconds
+        """
+        self._write_batch = write_batch
+        self.batch_size = batch_size
+        self.max_latency_ms = max_latency_ms
+        self._pending: Dict[str, TranslationJob] = {}
+        self._flush_event = asyncio.Event()
+        self._flush_task: Optional[asyncio.Task] = None
+
+    def get(self, job_id: str) -> Optional[TranslationJob]:
+        """
+        Return the buffered job for an ID, if one is waiting to be written.
+
+        Args:
+            job_id: ID of the job
+
+        Returns:
+            The buffered TranslationJob, or None
+        """
+        return self._pending.get(job_id)
+
+    def discard(self, job_id: str) -> None:
+        """
+        Drop a buffered job, e.g. because it is being written directly.
+
+        Args:
+            job_id: ID of the job
+        """
+        self._pending.pop(job_id, None)
+
+    def add(self, job: TranslationJob) -> None:
+        """
+        Queue a job for the next batch write.
+
+        A newer update for the same job replaces a still-buffered one.
+
+        Args:
+            job: TranslationJob to write
+        """
+        self._pending[job.job_id] = job
+        if len(self._pending) >= self.batch_size:
+            self._flush_event.set()
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        """
+        Background task flushing buffered jobs until the buffer is empty.
+
+        Waits up to max_latency_ms for the batch to fill before each flush,
+        and backs off between retries while writes keep failing. Errors are
+        logged by the writer rather than raised since nobody awaits this task.
+        """
+        retry_delay = self.max_latency_ms / 1000
+        while self._pending:
+            try:
+                await asyncio.wait_for(
+                    self._flush_event.wait(), timeout=self.max_latency_ms / 1000
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._flush_event.clear()
+            try:
+                await self.flush()
+                retry_delay = self.max_latency_ms / 1000
+            except Exception:
+                # The batch was re-queued by flush(); retry after a pause
+                await asyncio.sleep(retry_delay)
+                retry_delay = min(retry_delay * 2, _MAX_RETRY_DELAY)
+
+    async def flush(self) -> None:
+        """
+        Write all buffered jobs as one batch.
+
+        If the write fails (or is cancelled), the batch is put back into the
+        buffer so a later flush retries it; updates that arrived meanwhile
+        take precedence over the re-queued ones.
+
+        Raises:
+            Exception: If the batch writer fails
+        """
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, {}
+        try:
+            await self._write_batch(list(batch.values()))
+        except BaseException:
+            for job_id, job in batch.items():
+                self._pending.setdefault(job_id, job)
+            raise
+
+    async def aclose(self) -> None:
+        """
+        Stop the background flush and write everything still buffered.
+
+        A batch the background task was writing is re-queued when the task is
+        cancelled, so the final flush covers it; call this on shutdown before
+        closing the backend connections.
+
+        Raises:
+            Exception: If the final write fails
+        """
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+        self._flush_task = None
+        await self.flush()
@@ -1,5 +1,5 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.engine import make_url
 from contextlib import asynccontextmanager
 import logging
 from .models import Base
@@ -28,26 +28,41 @@ class DatabaseManager:
         async_session: Session factory for creating new sessions
     """
 
-    def __init__(self, database_url: str):
+    def __init__(self, database_url: str, pool_size: int = 20, max_overflow: int = 40):
         """
         Initialize database manager with connection settings.
 
         Args:
             database_url: SQLAlchemy connection URL for the database
+            pool_size: Connections kept open in the pool (default: 20)
+            max_overflow: Extra connections allowed when the pool is exhausted
+                (default: 40)
 
         Connection pool is configured with:
-        - pool_size: 5 concurrent connections
-        - max_overflow: 10 additional connections when pool is full
+        - pool_pre_ping: stale connections are replaced before use
+        - pool_recycle: connections are reopened after 30 minutes
+
+        With asyncpg, prepared statements are cached per connection (1024
+        entries), so repeated queries skip parse and plan, and the server-side
+        JIT is disabled since these short queries never benefit from it.
         """
+        connect_args = {}
+        if make_url(database_url).get_driver_name() == "asyncpg":
+            connect_args = {
+                "statement_cache_size": 1024,
+                "prepared_statement_cache_size": 1024,
+                "server_settings": {"jit": "off"},
+            }
         self.engine = create_async_engine(
             database_url,
             echo=False,  # Set to True for SQL logging
-            pool_size=5,
-            max_overflow=10,
-        )
-        self.async_session = sessionmaker(
-            self.engine, class_=AsyncSession, expire_on_commit=False
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_pre_ping=True,
+            pool_recycle=1800,
+            connect_args=connect_args,
         )
+        self.async_session = async_sessionmaker(self.engine, expire_on_commit=False)
 
     async def init_db(self):
         """
@@ -1,10 +1,34 @@
-from sqlalchemy import Column, String, DateTime, Enum as SQLAEnum, JSON
+from sqlalchemy import CheckConstraint, Column, String, DateTime, Index, JSON
+from sqlalchemy.types import TypeDecorator
 from sqlalchemy.ext.declarative import declarative_base
 from datetime import datetime, UTC
-from ..models.schemas import JobStatus
+from ..models.schemas import JobStatus, TranslationJob
 
 Base = declarative_base()
 
+# Allowed values for the status column, kept in sync with JobStatus
+_STATUS_VALUES = ", ".join(f"'{status.value}'" for status in JobStatus)
+
+
+class JobStatusType(TypeDecorator):
+    """
+    Stores JobStatus as its string value and reads it back as the enum member.
+
+    Rows map to the existing JobStatus singletons through a dict lookup, so
+    scanning many rows does not construct a new enum value per row.
+    """
+
+    impl = String(16)
+    cache_ok = True
+
+    _MEMBERS = {status.value: status for status in JobStatus}
+
+    def process_bind_param(self, value, dialect):
+        return value.value if isinstance(value, JobStatus) else value
+
+    def process_result_value(self, value, dialect):
+        return self._MEMBERS.get(value)
+
 
 class TranslationJobDB(Base):
     """
@@ -26,22 +50,32 @@ class TranslationJobDB(Base):
         job_id: Unique identifier for the translation job (primary key)
         source_language: Source language code of the content
         target_language: Target language code for translation
-        status: Current job status (from JobStatus enum)
+        status: Current job status (JobStatus value, enforced by a CHECK constraint)
         created_at: UTC timestamp of job creation
         completed_at: UTC timestamp of job completion (null if not completed)
         error_message: Error details if job failed (null if successful)
         job_metadata: Additional job-related data stored as JSON
 
     Table: translation_jobs
+
+    Indexes:
+        ix_translation_jobs_status_created_at: Serves status lookups in
+            creation order (e.g. FIFO scans of pending jobs)
     """
 
     __tablename__ = "translation_jobs"
+    __table_args__ = (
+        CheckConstraint(
+            f"status IN ({_STATUS_VALUES})", name="ck_translation_jobs_status"
+        ),
+        Index("ix_translation_jobs_status_created_at", "status", "created_at"),
+    )
 
     job_id = Column(String, primary_key=True)
     source_language = Column(String, nullable=False)
     target_language = Column(String, nullable=False)
     status = Column(
-        SQLAEnum(JobStatus), nullable=False, doc="Current status of the translation job"
+        JobStatusType(), nullable=False, doc="Current status of the translation job"
     )
     created_at = Column(
         DateTime(timezone=True),
@@ -55,5 +89,25 @@ class TranslationJobDB(Base):
     )
     error_message = Column(String, nullable=True, doc="Error details if job failed")
     job_metadata = Column(
-        JSON, default=dict, doc="Additional job-related data stored as JSON"
+        JSON(none_as_null=True),
+        doc="Additional job-related data stored as JSON; SQL NULL when absent",
     )
+
+    def to_schema(self) -> TranslationJob:
+        """
+        Convert the database row to the TranslationJob domain model.
+
+        Returns:
+            TranslationJob carrying the same field values
+        """
+        return TranslationJob(
+            job_id=self.job_id,
+            source_language=self.source_language,
+            target_language=self.target_language,
+            status=self.status,
+            created_at=self.created_at,
+            completed_at=self.completed_at,
+            error_message=self.error_message,
+            # Rows written before metadata became optional hold {}
+            metadata=self.job_metadata or None,
+        )
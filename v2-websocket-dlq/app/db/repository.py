@@ -1,6 +1,6 @@
-from sqlalchemy import select, update
+from sqlalchemy import bindparam, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Optional, List
+from typing import AsyncIterator, Optional, List
 from .models import TranslationJobDB
 from ..models.schemas import TranslationJob, JobStatus
 
@@ -60,6 +60,45 @@ class TranslationRepository:
         await self.session.flush()
         return db_job
 
+    async def create_jobs(self, jobs: List[TranslationJob]) -> List[TranslationJobDB]:
+        """
+        Create multiple translation job records in a single statement.
+
+        Issues one multi-row INSERT instead of a round-trip per job, for
+        bulk ingestion such as batch submissions or backlog replays.
+
+        Args:
+            jobs: TranslationJob domain model instances
+
+        Returns:
+            Created TranslationJobDB database model instances
+
+        Note:
+            Caller is responsible for committing the transaction
+        """
+        if not jobs:
+            return []
+
+        stmt = (
+            insert(TranslationJobDB)
+            .values(
+                [
+                    {
+                        "job_id": job.job_id,
+                        "source_language": job.source_language,
+                        "target_language": job.target_language,
+                        "status": job.status,
+                        "created_at": job.created_at,
+                        "job_metadata": job.metadata,
+                    }
+                    for job in jobs
+                ]
+            )
+            .returning(TranslationJobDB)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
+
     async def update_job_status(
         self, job: TranslationJob
     ) -> Optional[TranslationJobDB]:
@@ -88,19 +127,59 @@ class TranslationRepository:
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def update_jobs_status(self, jobs: List[TranslationJob]) -> None:
+        """
+        Update status and completion fields of several jobs in one statement.
+
+        Binds one parameter set per job to a single UPDATE, which the driver
+        sends as one executemany instead of a round-trip per job. Jobs without
+        a database row are skipped.
+
+        Args:
+            jobs: TranslationJob instances with updated status
+
+        Note:
+            Caller is responsible for committing the transaction
+        """
+        if not jobs:
+            return
+        table = TranslationJobDB.__table__
+        stmt = (
+            update(table)
+            .where(table.c.job_id == bindparam("b_job_id"))
+            .values(
+                status=bindparam("b_status"),
+                completed_at=bindparam("b_completed_at"),
+                error_message=bindparam("b_error_message"),
+            )
+        )
+        await self.session.execute(
+            stmt,
+            [
+                {
+                    "b_job_id": job.job_id,
+                    "b_status": job.status,
+                    "b_completed_at": job.completed_at,
+                    "b_error_message": job.error_message,
+                }
+                for job in jobs
+            ],
+        )
+
     async def get_job(self, job_id: str) -> Optional[TranslationJobDB]:
         """
         Retrieve a single job by its ID.
 
+        Primary-key lookup via the session identity map, so jobs already
+        loaded in this session are returned without a query.
+
         Args:
             job_id: Unique identifier of the job
 
         Returns:
             TranslationJobDB instance if found, None otherwise
         """
-        stmt = select(TranslationJobDB).where(TranslationJobDB.job_id == job_id)
-        result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
+        return await self.session.get(TranslationJobDB, job_id)
 
     async def get_jobs_by_status(self, status: JobStatus) -> List[TranslationJobDB]:
         """
@@ -110,12 +189,46 @@ class TranslationRepository:
             status: JobStatus enum value to filter by
 
         Returns:
-            List of TranslationJobDB instances matching the status
+            List of TranslationJobDB instances matching the status, oldest first
         """
-        stmt = select(TranslationJobDB).where(TranslationJobDB.status == status)
+        stmt = (
+            select(TranslationJobDB)
+            .where(TranslationJobDB.status == status)
+            .order_by(TranslationJobDB.created_at)
+        )
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
+    async def iter_jobs_by_status(
+        self, status: JobStatus, batch_size: int = 500
+    ) -> AsyncIterator[TranslationJobDB]:
+        """
+        Stream jobs with a specific status without loading them all at once.
+
+        Uses a server-side cursor that fetches batch_size rows at a time,
+        so memory stays constant regardless of how many jobs match.
+
+        Args:
+            status: JobStatus enum value to filter by
+            batch_size: Number of rows fetched per round-trip (default: 500)
+
+        Yields:
+            TranslationJobDB instances matching the status, oldest first
+
+        Example:
+            async for job in repo.iter_jobs_by_status(JobStatus.PENDING):
+                await processor.start_job(job.to_schema())
+        """
+        stmt = (
+            select(TranslationJobDB)
+            .where(TranslationJobDB.status == status)
+            .order_by(TranslationJobDB.created_at)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.session.stream_scalars(stmt)
+        async for job in result:
+            yield job
+
     async def get_pending_jobs(self) -> List[TranslationJobDB]:
         """
         Retrieve all jobs with PENDING status.
@@ -0,0 +1,92 @@
+import logging
+from typing import List
+from .database import DatabaseManager
+from .repository import TranslationRepository
+from ..core.write_buffer import WriteBehindBuffer
+from ..models.schemas import TranslationJob
+
+logger = logging.getLogger(__name__)
+
+
+class JobStatusWriter:
+    """
+    Batched database writer for job status updates.
+
+    Updates go through a WriteBehindBuffer, so a burst of updates costs one
+    session, one UPDATE executemany and one commit instead of a transaction
+    per update. Batches that fail to commit are retried.
+
+    Example:
+        writer = JobStatusWriter(db)
+        await writer.write(job)
+        ...
+        await writer.aclose()  # on shutdown
+
+    Attributes:
+        db: DatabaseManager providing sessions
+        _buffer: Write-behind buffer batching the updates
+    """
+
+    def __init__(
+        self, db: DatabaseManager, batch_size: int = 100, max_latency_ms: float = 10.0
+    ):
+        """
+        Initialize the status writer.
+
+        Args:
+            db: DatabaseManager providing sessions
+            batch_size: Buffered updates that trigger an immediate flush
+            max_latency_ms: Maximum buffering delay for updates in milliseconds
+        """
+        self.db = db
+        self._buffer = WriteBehindBuffer(
+            self._write_statuses, batch_size=batch_size, max_latency_ms=max_latency_ms
+        )
+
+    async def write(self, job: TranslationJob) -> None:
+        """
+        Queue a job status update for the database.
+
+        Args:
+            job: TranslationJob with updated status
+        """
+        self._buffer.add(job)
+
+    async def flush(self) -> None:
+        """
+        Write all buffered status updates in one transaction.
+
+        Raises:
+            Exception: If the database operation fails
+        """
+        await self._buffer.flush()
+
+    async def aclose(self) -> None:
+        """
+        Stop background flushing and write all buffered status updates.
+
+        A batch already in flight is re-queued and written with the rest;
+        call this on shutdown before the connections to the database are closed.
+
+        Raises:
+            Exception: If the final write fails
+        """
+        await self._buffer.aclose()
+
+    async def _write_statuses(self, jobs: List[TranslationJob]) -> None:
+        """
+        Store status updates for several jobs in one transaction.
+
+        Args:
+            jobs: TranslationJob instances with updated status
+
+        Raises:
+            Exception: If the database operation fails
+        """
+        try:
+            async with self.db.get_session() as session:
+                await TranslationRepository(session).update_jobs_status(jobs)
+            logger.info(f"Stored status updates for {len(jobs)} jobs")
+        except Exception as e:
+            logger.error(f"Error storing status updates for {len(jobs)} jobs: {e}")
+            raise
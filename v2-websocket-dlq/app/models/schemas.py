@@ -2,7 +2,7 @@ from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional, Dict, Any
 from enum import Enum
 from datetime import datetime, UTC
-import json
+import orjson
 
 
 class JobStatus(str, Enum):
@@ -62,7 +62,7 @@ class TranslationJob(BaseModel):
         created_at: UTC timestamp of creation
         completed_at: UTC timestamp of completion (if finished)
         error_message: Error details if failed
-        metadata: Additional job-related data
+        metadata: Additional job-related data, None when not provided
     """
 
     job_id: str
@@ -72,18 +72,57 @@ class TranslationJob(BaseModel):
     created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
     completed_at: Optional[datetime] = None
     error_message: Optional[str] = None
-    metadata: Dict[str, Any] = Field(default_factory=dict)
+    metadata: Optional[Dict[str, Any]] = None
 
     model_config = ConfigDict(json_encoders={datetime: datetime_handler})
 
+    @property
+    def metadata_safe(self) -> Dict[str, Any]:
+        """
+        Job metadata for readers, with absent metadata as an empty dict.
+
+        Returns:
+            The metadata dict, or a new empty dict if none was given
+        """
+        return self.metadata or {}
+
     def model_dump_json(self, **kwargs):
         """
         Serialize model to JSON string with datetime handling.
 
+        Uses orjson, which encodes datetimes and enums natively; this is the
+        payload broadcast to every websocket client on each status change.
+
         Returns:
             JSON string representation of the model
         """
-        return json.dumps(self.model_dump(), default=datetime_handler)
+        return orjson.dumps(self.model_dump(), default=datetime_handler).decode()
+
+    def status_json_bytes(self) -> bytes:
+        """
+        Serialize the job as a status frame, omitting None-valued fields.
+
+        This is the one wire format for everything sent on a job's websocket:
+        live pushes, replays to late connections, and results served from the
+        cache or the DLQ. Fields that are None (completed_at while pending,
+        error_message on success, metadata when none was given) are left out,
+        so clients read them with .get().
+
+        Returns:
+            UTF-8 encoded JSON of the job without None-valued fields
+        """
+        return orjson.dumps(
+            self.model_dump(exclude_none=True), default=datetime_handler
+        )
+
+    def status_json(self) -> str:
+        """
+        Serialize the job as a status frame (see status_json_bytes).
+
+        Returns:
+            JSON string of the job without None-valued fields
+        """
+        return self.status_json_bytes().decode()
 
 
 class TranslationRequest(BaseModel):
@@ -96,12 +135,12 @@ class TranslationRequest(BaseModel):
     Attributes:
         source_language: Original language code
         target_language: Target language code
-        metadata: Optional additional request data
+        metadata: Optional additional request data, None when omitted
     """
 
     source_language: str
     target_language: str
-    metadata: Dict[str, Any] = Field(default_factory=dict)
+    metadata: Optional[Dict[str, Any]] = None
 
 
 class TranslationResponse(BaseModel):
@@ -120,3 +159,15 @@ class TranslationResponse(BaseModel):
     job_id: str
     status: JobStatus
     message: Optional[str] = None
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize the response to JSON bytes for a raw HTTP response body.
+
+        Calls the model's compiled serializer directly, skipping
+        model_dump_json's keyword handling and the str round-trip.
+
+        Returns:
+            UTF-8 encoded JSON of the response
+        """
+        return self.__pydantic_serializer__.to_json(self)
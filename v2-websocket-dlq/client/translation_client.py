@@ -1,7 +1,13 @@
 import asyncio
 import aiohttp
 import logging
-from typing import Optional, Dict, Any
+import os
+import random
+import socket
+import orjson
+from yarl import URL
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Mapping
 from enum import Enum
 
 logger = logging.getLogger(__name__)
@@ -33,6 +39,31 @@ class JobStatus(str, Enum):
     ERROR = "error"
 
 
+# Plain strings for the per-message status check (skips Enum.__eq__)
+_COMPLETED = JobStatus.COMPLETED.value
+_ERROR = JobStatus.ERROR.value
+_TERMINAL_STATUSES = frozenset((_COMPLETED, _ERROR))
+
+# Shared read-only default so omitted metadata costs no allocation per call
+_EMPTY_METADATA: Mapping[str, Any] = MappingProxyType({})
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Websocket socket tuning: 128 KiB receive buffer, larger frame limit
+_WS_RECV_BUFFER = 128 * 1024
+_WS_MAX_MSG_SIZE = 16 * 1024 * 1024
+# Unanswered keepalive probes before the kernel drops the connection
+_KEEPALIVE_PROBES = 3
+
+# Constructor options readable from TRANSLATION_CLIENT_<NAME> variables
+_ENV_OPTIONS = {
+    "base_url": str,
+    "max_retries": int,
+    "retry_delay": float,
+    "timeout": float,
+    "heartbeat_interval": float,
+}
+
+
 class TranslationClient:
     """
     Async client for interacting with the video translation service.
@@ -46,12 +77,21 @@ class TranslationClient:
             job = await client.start_translation("en", "es")
             result = await client.wait_for_completion(job["job_id"])
 
+        Share one connection pool across several clients:
+        async with aiohttp.ClientSession() as session:
+            async with TranslationClient(url, session=session) as client:
+                ...
+
     Attributes:
         base_url: Base URL of the translation service
         max_retries: Maximum retry attempts for failed operations
-        retry_delay: Delay between retries in seconds
+        retry_delay: Initial delay between retries in seconds
+        max_retry_delay: Upper bound on the backoff delay in seconds
+        backoff_factor: Multiplier applied to the delay after each retry
         timeout: Operation timeout in seconds
-        heartbeat_interval: WebSocket ping interval in seconds
+        heartbeat_interval: Idle time in seconds before the connection is probed
+        websocket_pings: Whether to send application-level WebSocket pings
+        connection_limit: Maximum pooled connections per host for owned sessions
     """
 
     def __init__(
@@ -61,6 +101,11 @@ class TranslationClient:
         retry_delay: float = 1.0,
         timeout: float = 30.0,
         heartbeat_interval: float = 5.0,
+        session: Optional[aiohttp.ClientSession] = None,
+        connection_limit: int = 100,
+        max_retry_delay: float = 30.0,
+        backoff_factor: float = 2.0,
+        websocket_pings: bool = False,
     ):
         """
         Initialize translation client.
@@ -68,44 +113,118 @@ class TranslationClient:
         Args:
             base_url: Service base URL
             max_retries: Max retry attempts for operations
-            retry_delay: Seconds between retries
+            retry_delay: Seconds before the first retry
             timeout: Operation timeout in seconds
-            heartbeat_interval: WebSocket ping interval
+            heartbeat_interval: Idle seconds before TCP keepalive probes (and
+                WebSocket pings, if enabled) check the connection
+            session: Existing session to share; it is left open on exit
+            connection_limit: Per-host connection pool size when the client
+                creates its own session
+            max_retry_delay: Cap on the exponential backoff delay in seconds
+            backoff_factor: Growth factor of the delay between retries
+            websocket_pings: Also send WebSocket pings every heartbeat_interval;
+                only needed for servers that drop connections without them
         """
         self.base_url = base_url.rstrip("/")
+        # Websocket base keeps TLS: https maps to wss, http to ws
+        self._ws_base = URL(self.base_url).with_scheme(
+            "wss" if self.base_url.startswith("https") else "ws"
+        )
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.backoff_factor = backoff_factor
         self.timeout = timeout
         self.heartbeat_interval = heartbeat_interval
-        self._session: Optional[aiohttp.ClientSession] = None
+        self.websocket_pings = websocket_pings
+        self.connection_limit = connection_limit
+        self._session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
+
+    @classmethod
+    def from_env(cls, **overrides: Any) -> "TranslationClient":
+        """
+        Build a client from TRANSLATION_CLIENT_* environment variables.
+
+        Lets worker processes construct their own client (and session)
+        without passing objects across process boundaries. Recognized
+        variables: TRANSLATION_CLIENT_BASE_URL, _MAX_RETRIES, _RETRY_DELAY,
+        _TIMEOUT and _HEARTBEAT_INTERVAL.
+
+        Args:
+            **overrides: Constructor arguments taking precedence over the
+                environment
+
+        Returns:
+            Unopened TranslationClient; use it as an async context manager
+
+        Raises:
+            ValueError: If a variable does not hold a valid value
+        """
+        options: Dict[str, Any] = {}
+        for name, convert in _ENV_OPTIONS.items():
+            variable = f"TRANSLATION_CLIENT_{name.upper()}"
+            if (value := os.environ.get(variable)) is not None:
+                try:
+                    options[name] = convert(value)
+                except ValueError:
+                    raise ValueError(
+                        f"Invalid value for {variable}: {value!r}"
+                    ) from None
+        options.update(overrides)
+        options.setdefault("base_url", "http://localhost:8000")
+        return cls(**options)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Pickle the client configuration without its session.
+
+        Sessions are bound to an event loop; an unpickled client opens a new
+        one when entered in the receiving process.
+
+        Returns:
+            Picklable instance state
+        """
+        state = self.__dict__.copy()
+        state["_session"] = None
+        state["_owns_session"] = True
+        return state
 
     async def __aenter__(self):
         """
         Context manager entry - initialize HTTP session.
 
+        Creates a pooled session unless one was passed to the constructor.
+
         Returns:
             Initialized client instance
         """
-        self._session = aiohttp.ClientSession()
+        if self._owns_session:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit_per_host=self.connection_limit, ttl_dns_cache=300
+                )
+            )
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """
-        Context manager exit - cleanup HTTP session.
+        Context manager exit - cleanup HTTP session if owned by the client.
 
         Args:
             exc_type: Exception type if raised
             exc_val: Exception instance if raised
             exc_tb: Exception traceback if raised
         """
-        if self._session:
+        if self._owns_session and self._session:
             await self._session.close()
+            self._session = None
 
     async def start_translation(
         self,
         source_language: str,
         target_language: str,
-        metadata: Dict[str, Any] = None,
+        metadata: Optional[Mapping[str, Any]] = None,
     ) -> Dict[str, Any]:
         """
         Start a new translation job.
@@ -125,36 +244,128 @@ class TranslationClient:
             raise TranslationError("Client session not initialized")
 
         try:
+            body = {
+                "source_language": source_language,
+                "target_language": target_language,
+                "metadata": metadata if metadata is not None else _EMPTY_METADATA,
+            }
+            # orjson emits bytes directly; default=dict covers non-dict mappings
             async with self._session.post(
                 f"{self.base_url}/translate",
-                json={
-                    "source_language": source_language,
-                    "target_language": target_language,
-                    "metadata": metadata or {},
-                },
+                data=orjson.dumps(body, default=dict),
+                headers=_JSON_HEADERS,
                 timeout=self.timeout,
+                raise_for_status=True,
             ) as response:
-                response.raise_for_status()
-                return await response.json()
-        except Exception as e:
-            raise TranslationError(f"Failed to start translation: {e}")
+                return await response.json(loads=orjson.loads)
+        except (aiohttp.ClientError, asyncio.TimeoutError, orjson.JSONDecodeError) as e:
+            raise TranslationError("Failed to start translation") from e
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """
+        Compute the delay before a retry using capped exponential backoff.
 
-    async def _send_heartbeat(self, ws: aiohttp.ClientWebSocketResponse):
+        Jitter spreads reconnects out so clients failing together do not
+        retry in lockstep against a struggling server.
+
+        Args:
+            attempt: Number of failed attempts so far (starting at 1)
+
+        Returns:
+            Delay in seconds
+        """
+        delay = min(
+            self.retry_delay * self.backoff_factor ** (attempt - 1),
+            self.max_retry_delay,
+        )
+        return delay * (0.5 + random.random())
+
+    def _tune_socket(self, ws: aiohttp.ClientWebSocketResponse) -> None:
         """
-        Send periodic ping messages to keep WebSocket alive.
+        Tune a websocket's socket for small, latency-sensitive frames.
+
+        Disables Nagle, enlarges the receive buffer and enables TCP keepalive
+        so dead connections are detected by the kernel without waking the
+        event loop for application-level pings.
+
+        Args:
+            ws: Freshly connected websocket
+        """
+        sock = ws.get_extra_info("socket")
+        if sock is None or sock.family not in (socket.AF_INET, socket.AF_INET6):
+            return
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _WS_RECV_BUFFER)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        # Keepalive timing options are platform specific (Linux names here)
+        interval = max(1, int(self.heartbeat_interval))
+        for option, value in (
+            ("TCP_KEEPIDLE", interval),
+            ("TCP_KEEPINTVL", interval),
+            ("TCP_KEEPCNT", _KEEPALIVE_PROBES),
+        ):
+            if hasattr(socket, option):
+                sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, option), value)
+
+    @staticmethod
+    def _final_update(job_id: str, data: Any) -> Optional[Dict[str, Any]]:
+        """
+        Interpret a decoded websocket frame carrying one job update.
 
         Args:
-            ws: Active WebSocket connection
+            job_id: ID of the monitored job
+            data: Decoded frame payload
 
-        Note:
-            Runs until connection closes or error occurs
+        Returns:
+            The completed job's data, or None if the job is still pending
+
+        Raises:
+            TranslationError: If the update reports the job as failed, or the
+                frame is not an update object
         """
-        try:
-            while True:
-                await ws.ping()
-                await asyncio.sleep(self.heartbeat_interval)
-        except Exception:
-            pass
+        if not isinstance(data, dict):
+            raise TranslationError("Malformed status frame")
+
+        status = data.get("status")
+        if status not in _TERMINAL_STATUSES:
+            # Pending updates, the common case, cost a single set lookup
+            return None
+
+        if status == _COMPLETED:
+            logger.info("Job %s completed successfully", job_id)
+            return data
+        error_msg = data.get("error_message") or "Unknown error"
+        raise TranslationError(f"Translation failed: {error_msg}")
+
+    @classmethod
+    def _read_frame(
+        cls, job_id: str, msg: aiohttp.WSMessage
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Interpret a single websocket message for the monitored job.
+
+        Args:
+            job_id: ID of the monitored job
+            msg: Message received from the websocket
+
+        Returns:
+            The completed job's data, or None if the job is still pending
+
+        Raises:
+            TranslationError: If the update reports the job as failed
+            aiohttp.ServerDisconnectedError: If the connection closed
+        """
+        if msg.type in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
+            return cls._final_update(job_id, orjson.loads(msg.data))
+        if msg.type in (
+            aiohttp.WSMsgType.CLOSE,
+            aiohttp.WSMsgType.CLOSING,
+            aiohttp.WSMsgType.CLOSED,
+            aiohttp.WSMsgType.ERROR,
+        ):
+            # A connection error, not a job failure: the caller retries it
+            raise aiohttp.ServerDisconnectedError("WebSocket connection closed")
+        return None
 
     async def wait_for_completion(self, job_id: str) -> Dict[str, Any]:
         """
@@ -177,60 +388,50 @@ class TranslationClient:
         if not self._session:
             raise TranslationError("Client session not initialized")
 
-        ws_url = f"ws://{self.base_url.split('://')[-1]}/ws/job/{job_id}"
+        # Loop invariants, resolved once rather than on every reconnect
+        ws_url = self._ws_base / "ws" / "job" / job_id
+        loop = asyncio.get_running_loop()
+        read_frame = self._read_frame
         retries = 0
 
         while retries < self.max_retries:
             try:
-                async with self._session.ws_connect(ws_url) as ws:
-                    # Start heartbeat task
-                    heartbeat_task = asyncio.create_task(self._send_heartbeat(ws))
-
+                # Liveness comes from TCP keepalive; aiohttp's own pings are
+                # opt-in for servers that require them
+                async with self._session.ws_connect(
+                    ws_url,
+                    heartbeat=self.heartbeat_interval if self.websocket_pings else None,
+                    max_msg_size=_WS_MAX_MSG_SIZE,
+                    compress=0,  # small JSON frames; deflate costs more than it saves
+                ) as ws:
+                    self._tune_socket(ws)
+                    # Plain receive loop with a shared deadline: no async
+                    # iterator or timeout context per connection. A finished
+                    # job is answered by the very first frame.
+                    deadline = loop.time() + self.timeout
                     try:
-                        async with asyncio.timeout(self.timeout):
-                            async for msg in ws:
-                                if msg.type == aiohttp.WSMsgType.TEXT:
-                                    data = msg.json()
-                                    status = data.get("status")
-
-                                    if status == JobStatus.COMPLETED:
-                                        logger.info(
-                                            f"Job {job_id} completed successfully"
-                                        )
-                                        return data
-                                    elif status == JobStatus.ERROR:
-                                        error_msg = data.get(
-                                            "error_message", "Unknown error"
-                                        )
-                                        raise TranslationError(
-                                            f"Translation failed: {error_msg}"
-                                        )
-
-                                elif msg.type in (
-                                    aiohttp.WSMsgType.CLOSED,
-                                    aiohttp.WSMsgType.ERROR,
-                                ):
-                                    raise TranslationError(
-                                        f"WebSocket error: Connection closed"
-                                    )
+                        while True:
+                            msg = await ws.receive(timeout=deadline - loop.time())
+                            result = read_frame(job_id, msg)
+                            if result is not None:
+                                return result
 
                     except asyncio.TimeoutError:
                         logger.warning(
-                            f"Connection timeout for job {job_id}, retrying..."
+                            "Connection timeout for job %s, retrying...", job_id
                         )
-                    finally:
-                        heartbeat_task.cancel()
-                        try:
-                            await heartbeat_task
-                        except asyncio.CancelledError:
-                            pass
 
-            except Exception as e:
-                logger.error(f"Error while waiting for job {job_id}: {e}")
+            except (
+                aiohttp.ClientError,
+                asyncio.TimeoutError,
+                orjson.JSONDecodeError,
+            ) as e:
+                # Job failures (TranslationError) propagate; only retry transport
+                logger.error("Error while waiting for job %s: %s", job_id, e)
 
             retries += 1
             if retries < self.max_retries:
-                await asyncio.sleep(self.retry_delay)
+                await asyncio.sleep(self._backoff_delay(retries))
 
         raise TranslationError(
             f"Failed to get job result after {self.max_retries} retries"
@@ -0,0 +1,39 @@
+"""status_as_varchar_with_check
+
+Revision ID: 8d2c41f0a7e9
+Revises: 363b213b151b
+Create Date: 2026-10-15 10:47:09.552817
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d2c41f0a7e9'
+down_revision: Union[str, None] = '363b213b151b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The jobstatus enum stored member names; the column now stores values
+    op.alter_column('translation_jobs', 'status',
+               existing_type=sa.Enum('PENDING', 'COMPLETED', 'ERROR', name='jobstatus'),
+               type_=sa.String(length=16),
+               existing_nullable=False,
+               postgresql_using='lower(status::text)')
+    op.execute('DROP TYPE jobstatus')
+    op.create_check_constraint('ck_translation_jobs_status', 'translation_jobs', "status IN ('pending', 'completed', 'error')")
+
+
+def downgrade() -> None:
+    op.drop_constraint('ck_translation_jobs_status', 'translation_jobs', type_='check')
+    op.execute("CREATE TYPE jobstatus AS ENUM ('PENDING', 'COMPLETED', 'ERROR')")
+    op.alter_column('translation_jobs', 'status',
+               existing_type=sa.String(length=16),
+               type_=sa.Enum('PENDING', 'COMPLETED', 'ERROR', name='jobstatus'),
+               existing_nullable=False,
+               postgresql_using='upper(status)::jobstatus')
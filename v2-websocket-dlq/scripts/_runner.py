@@ -0,0 +1,32 @@
+import asyncio
+from typing import Any, Coroutine, TypeVar
+
+"""
+Shared event-loop runner for the test scripts.
+
+Runs script entry points on uvloop when it is installed, falling back to
+the stock asyncio loop otherwise. The loop is chosen through a loop factory
+rather than a global policy, so importing this module has no side effects.
+"""
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is optional (e.g. on Windows)
+    uvloop = None
+
+T = TypeVar("T")
+
+
+def run(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion on a fresh event loop.
+
+    Args:
+        coro: Script entry point coroutine
+
+    Returns:
+        Result of the coroutine
+    """
+    loop_factory = uvloop.new_event_loop if uvloop else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        return runner.run(coro)
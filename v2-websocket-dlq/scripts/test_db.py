@@ -1,5 +1,5 @@
-import asyncio
 import asyncpg
+from scripts._runner import run
 
 
 async def test_connection():
@@ -48,4 +48,4 @@ if __name__ == "__main__":
     Executes the database connection test in an async context and
     prints the results.
     """
-    asyncio.run(test_connection())
+    run(test_connection())
@@ -1,7 +1,3 @@
-import os
-import sys
-from pathlib import Path
-
 """
 Dead Letter Queue (DLQ) operations test script.
 
@@ -11,15 +7,9 @@ Tests the functionality of the DLQ management system including:
 - Bulk DLQ operations and queries
 """
 
-# Setup project imports
-current_dir = Path(__file__).resolve().parent
-project_root = current_dir.parent
-print(f"Adding to path: {project_root}")
-sys.path.insert(0, str(project_root))
-
-import asyncio
 from datetime import datetime, UTC
 from app.models.schemas import TranslationJob, JobStatus
+from scripts._runner import run
 from app.core.dlq_manager import DLQManager
 
 
@@ -55,25 +45,21 @@ async def test_dlq_operations():
         )
         print(f"Created test job: {test_job}")
 
-        # Test result storage and DLQ addition
-        await dlq.store_result(test_job)
-        await dlq.add_to_dlq(test_job.job_id)
-        print("Added job to DLQ")
+        # Run every operation in one pipelined round-trip; Redis applies
+        # them in order, so reads observe the preceding writes
+        async with dlq.pipeline() as pipe:
+            pipe.store_result(test_job)
+            pipe.add_to_dlq(test_job.job_id)
+            pipe.is_in_dlq(test_job.job_id)
+            pipe.get_result(test_job.job_id)
+            pipe.get_dlq_jobs()
+            pipe.remove_from_dlq(test_job.job_id)
+            _, _, in_dlq, result, dlq_jobs, _ = await pipe.execute()
 
-        # Test DLQ membership check
-        in_dlq = await dlq.is_in_dlq(test_job.job_id)
+        print("Added job to DLQ")
         print(f"Job in DLQ: {in_dlq}")
-
-        # Test result retrieval
-        result = await dlq.get_result(test_job.job_id)
         print(f"Retrieved result: {result}")
-
-        # Test bulk DLQ operations
-        dlq_jobs = await dlq.get_dlq_jobs()
         print(f"All DLQ jobs: {dlq_jobs}")
-
-        # Test cleanup operations
-        await dlq.remove_from_dlq(test_job.job_id)
         print("Removed job from DLQ")
 
         print("\nTest successful!")
@@ -95,4 +81,4 @@ if __name__ == "__main__":
         connection settings (localhost:6379).
     """
     # Run the async test function
-    asyncio.run(test_dlq_operations())
+    run(test_dlq_operations())
@@ -0,0 +1,100 @@
+import aiohttp
+import asyncio
+import pickle
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from client.translation_client import TranslationClient, TranslationError
+
+
+@pytest.mark.parametrize(
+    "frame", [5, None, "completed", [], [{"status": "completed"}], [1, None]]
+)
+def test_malformed_frames_raise_translation_error(frame):
+    """Frames that are not update objects are rejected cleanly"""
+    with pytest.raises(TranslationError, match="Malformed status frame"):
+        TranslationClient._final_update("job-1", frame)
+
+
+def test_update_objects_are_accepted():
+    """Pending updates are skipped and terminal ones end the wait"""
+    done = {"job_id": "job-1", "status": "completed"}
+    assert TranslationClient._final_update("job-1", {"status": "pending"}) is None
+    assert TranslationClient._final_update("job-1", done) == done
+    with pytest.raises(TranslationError, match="Unknown error"):
+        TranslationClient._final_update("job-1", {"status": "error"})
+
+
+def test_from_env_reads_options(monkeypatch):
+    """Environment variables configure the client and overrides win"""
+    monkeypatch.setenv("TRANSLATION_CLIENT_BASE_URL", "https://api.example.com/")
+    monkeypatch.setenv("TRANSLATION_CLIENT_MAX_RETRIES", "7")
+    monkeypatch.setenv("TRANSLATION_CLIENT_TIMEOUT", "2.5")
+
+    client = TranslationClient.from_env(max_retries=1)
+
+    assert client.base_url == "https://api.example.com"
+    assert str(client._ws_base) == "wss://api.example.com"
+    assert client.max_retries == 1
+    assert client.timeout == 2.5
+
+
+def test_from_env_defaults_and_rejects_bad_values(monkeypatch):
+    """Unset variables fall back to defaults; unparsable ones name the variable"""
+    for name in (
+        "BASE_URL",
+        "MAX_RETRIES",
+        "RETRY_DELAY",
+        "TIMEOUT",
+        "HEARTBEAT_INTERVAL",
+    ):
+        monkeypatch.delenv(f"TRANSLATION_CLIENT_{name}", raising=False)
+    assert TranslationClient.from_env().base_url == "http://localhost:8000"
+
+    monkeypatch.setenv("TRANSLATION_CLIENT_MAX_RETRIES", "three")
+    with pytest.raises(ValueError, match="TRANSLATION_CLIENT_MAX_RETRIES"):
+        TranslationClient.from_env()
+
+
+@pytest.mark.asyncio
+async def test_pickled_client_drops_session():
+    """A pickled client keeps its configuration but not its session"""
+    async with aiohttp.ClientSession() as session:
+        client = TranslationClient(
+            "https://api.example.com", max_retries=4, session=session
+        )
+        restored = pickle.loads(pickle.dumps(client))
+
+    assert restored._session is None
+    assert restored._owns_session
+    assert restored._ws_base == client._ws_base
+    assert restored.max_retries == 4
+    assert restored.base_url == client.base_url
+    # The original still shares the caller's session
+    assert client._session is session and not client._owns_session
+
+
+@pytest.mark.asyncio
+async def test_pending_frames_do_not_reset_retry_budget():
+    """A server that drops the socket after every pending frame exhausts retries"""
+    connects = []
+
+    async def flaky_ws(request):
+        connects.append(request.match_info["job_id"])
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        await ws.send_str('{"job_id": "job-1", "status": "pending"}')
+        await ws.close()
+        return ws
+
+    app = web.Application()
+    app.router.add_get("/ws/job/{job_id}", flaky_ws)
+    async with TestServer(app) as server:
+        base_url = str(server.make_url("")).rstrip("/")
+        async with TranslationClient(
+            base_url, max_retries=3, retry_delay=0.01
+        ) as client:
+            with pytest.raises(TranslationError, match="after 3 retries"):
+                await asyncio.wait_for(client.wait_for_completion("job-1"), 5)
+
+    assert connects == ["job-1"] * 3
@@ -0,0 +1,81 @@
+import pytest
+from datetime import datetime, UTC
+from app.core.cache_manager import CacheManager
+from app.core.connection_manager import ConnectionManager
+from app.core.dlq_manager import DLQManager
+from app.db.models import TranslationJobDB
+from app.models.schemas import JobStatus, TranslationJob
+
+# Nothing listens here, so Redis writes fail fast and are only logged
+UNREACHABLE_REDIS = "redis://127.0.0.1:1/0"
+
+
+class OfflineDLQ(DLQManager):
+    """DLQ manager whose Redis set and hash are left untouched"""
+
+    async def add_to_dlq(self, job_id):
+        pass
+
+    async def remove_from_dlq(self, job_id):
+        pass
+
+    async def is_in_dlq(self, job_id):
+        return False
+
+    async def store_result(self, job):
+        pass
+
+    async def get_result_payload(self, job_id):
+        return None
+
+
+class RecordingWebSocket:
+    """Collects the text frames sent to it"""
+
+    def __init__(self):
+        self.frames = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, data):
+        self.frames.append(data)
+
+
+@pytest.mark.asyncio
+async def test_socket_frames_share_one_format():
+    """Live pushes, replays, cache hits and DLQ results send identical frames"""
+    job = TranslationJob(
+        job_id="job-1",
+        source_language="en",
+        target_language="es",
+        status=JobStatus.COMPLETED,
+        completed_at=datetime.now(UTC),
+    )
+
+    manager = ConnectionManager(dlq_manager=OfflineDLQ(UNREACHABLE_REDIS))
+    live, late = RecordingWebSocket(), RecordingWebSocket()
+    await manager.connect(job.job_id, live)
+    await manager.update_job_status(job)
+    await manager.connect(job.job_id, late)
+
+    cache = CacheManager(UNREACHABLE_REDIS)
+    cached = await cache.cache_job_status(job)
+    db_row = TranslationJobDB(
+        job_id=job.job_id,
+        source_language=job.source_language,
+        target_language=job.target_language,
+        status=job.status,
+        created_at=job.created_at,
+        completed_at=job.completed_at,
+    )
+    from_db = await cache.cache_job_status(db_row.to_schema())
+
+    dlq = DLQManager(UNREACHABLE_REDIS, max_latency_ms=60_000)
+    await dlq.store_result(job)
+    from_dlq = await dlq.get_result_payload(job.job_id)
+    dlq._buffer.discard(job.job_id)
+    await dlq.aclose()
+
+    assert live.frames == late.frames == [job.status_json()]
+    assert cached.decode() == from_db.decode() == from_dlq == job.status_json()
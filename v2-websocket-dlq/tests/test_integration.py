@@ -20,6 +20,16 @@ def get_free_port():
         port = s.getsockname()[1]
     return port
 
+def wait_for_server(port, timeout=10.0):
+    """Poll until the server accepts TCP connections on the port"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            if s.connect_ex(('127.0.0.1', port)) == 0:
+                return
+        time.sleep(0.02)
+    raise RuntimeError(f"Server did not start on port {port} within {timeout}s")
+
 @pytest.fixture(scope="module")
 def server_port():
     """Get a free port for the server"""
@@ -39,7 +49,7 @@ def server(server_port):
     server_thread = threading.Thread(target=run_server)
     server_thread.daemon = True
     server_thread.start()
-    time.sleep(2)  # Wait for server to start
+    wait_for_server(server_port)
     yield server_thread
 
 @pytest.mark.asyncio